@@ -55,7 +55,7 @@ class ValidationResult:
     pattern: Optional[EARSPattern] = None
 
 
-@dataclass
+@dataclass(frozen=True)
 class QualityIssue:
     """INCOSE quality rule violation."""
     rule: str
@@ -8,6 +8,7 @@ and basic feature planning operations.
 import argparse
 import json
 import sys
+from dataclasses import asdict
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -107,11 +108,11 @@ def config_command(args: argparse.Namespace) -> int:
         if args.action == 'show':
             config = system.get_configuration()
             if args.format == 'json':
-                print(json.dumps(config.__dict__, indent=2))
+                print(json.dumps(asdict(config), indent=2))
             else:
                 print("Current Configuration:")
                 print("=" * 30)
-                for key, value in config.__dict__.items():
+                for key, value in asdict(config).items():
                     print(f"{key}: {value}")
         
         elif args.action == 'set':
@@ -6,17 +6,52 @@ and Kiro's infrastructure, including file system tools, user input mechanisms,
 and task status management.
 """
 
-import json
+import atexit
+import os
+import time
+import weakref
+from collections import OrderedDict, defaultdict, deque
+from contextlib import contextmanager, suppress
 from dataclasses import asdict, dataclass
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from types import MappingProxyType
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    TYPE_CHECKING,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from .base import WorkflowError
-from .spec_manager import SpecManager
-from .workflow_controller import WorkflowController
 
+if TYPE_CHECKING:
+    from .spec_manager import SpecManager
+    from .workflow_controller import WorkflowController
 
-@dataclass
+# Buffer size used when flushing pending writes to disk
+_WRITE_BUFFER_SIZE = 1 << 17
+
+# Maximum number of file contents kept by the read cache
+_READ_CACHE_SIZE = 128
+
+# Maximum number of records kept in each adapter history
+_HISTORY_SIZE = 1024
+
+# Batched task status updates are flushed once this many are pending
+# or the oldest pending update is older than the max age (seconds)
+_STATUS_BATCH_SIZE = 64
+_STATUS_BATCH_MAX_AGE = 0.1
+
+
+@dataclass(slots=True)
 class KiroToolResult:
     """Result from a Kiro tool operation"""
 
@@ -25,127 +60,306 @@ class KiroToolResult:
     error: Optional[str] = None
 
 
+@dataclass(slots=True)
+class FileOperation:
+    """Record of a file operation performed through the adapter"""
+
+    operation: str
+    path: str
+    success: bool = True
+
+
+@dataclass(slots=True)
+class InputRequest:
+    """Record of a user input request"""
+
+    question: str
+    reason: str
+    options: Optional[List[str]] = None
+    timestamp: Optional[str] = None  # Would be set by actual Kiro tool
+
+
+@dataclass(slots=True)
+class StatusUpdate:
+    """Record of a task status update"""
+
+    task_file_path: str
+    task: str
+    status: str
+    timestamp: Optional[str] = None  # Would be set by actual Kiro tool
+
+
+@dataclass(frozen=True)
+class FeaturePaths:
+    """Precomputed paths of a feature specification"""
+
+    base: Path
+    requirements_md: str
+    design_md: str
+    tasks_md: str
+
+    @classmethod
+    def for_feature(cls, feature_name: str) -> "FeaturePaths":
+        """Build the path set for a feature under .kiro/specs"""
+        base = Path(".kiro/specs") / feature_name
+        return cls(
+            base=base,
+            requirements_md=str(base / "requirements.md"),
+            design_md=str(base / "design.md"),
+            tasks_md=str(base / "tasks.md"),
+        )
+
+
 class KiroFileSystemAdapter:
     """Adapter for Kiro's file system operations"""
 
     def __init__(self) -> None:
-        self._file_operations: List[Dict[str, Any]] = []
+        self._file_operations: Deque[FileOperation] = deque(maxlen=_HISTORY_SIZE)
+        # Operations recorded so far, also used to invalidate status caches
+        self._version = 0
+        # (version, records) last returned by get_operations_log
+        self._log_view: Tuple[int, Tuple[Mapping[str, Any], ...]] = (-1, ())
+        # Write-back buffer: pending chunks and open mode per path
+        self._pending: Dict[str, List[str]] = defaultdict(list)
+        self._pending_mode: Dict[str, str] = {}
+        self._batch_depth = 0
+        # Parent directories already created by this adapter
+        self._dirs_created: set = set()
+        # LRU read cache: path -> ((st_mtime_ns, st_size), content)
+        self._content_cache: "OrderedDict[str, Tuple[Tuple[int, int], str]]" = (
+            OrderedDict()
+        )
+        _live_file_adapters.add(self)
 
     def write_file(self, path: str, content: str) -> KiroToolResult:
         """Write content to a file using Kiro's fsWrite tool"""
-        try:
-            # In actual Kiro environment, this would call the fsWrite tool
-            # For now, we'll simulate the operation
-            file_path = Path(path)
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(content)
-
-            self._file_operations.append(
-                {"operation": "write", "path": path, "success": True}
-            )
-
-            return KiroToolResult(success=True, data={"path": path})
-        except Exception as e:
-            return KiroToolResult(success=False, error=str(e))
+        # In actual Kiro environment, this would call the fsWrite tool
+        # For now, we'll simulate the operation
+        self._pending[path] = [content]
+        self._pending_mode[path] = "w"
+        return self._commit("write", path)
 
     def read_file(self, path: str) -> KiroToolResult:
         """Read file content using Kiro's readFile tool"""
         try:
+            if path in self._pending:
+                self._flush_path(path)
+
+            stat = os.stat(path)
+            signature = (stat.st_mtime_ns, stat.st_size)
+            cached = self._content_cache.get(path)
+            if cached is not None and cached[0] == signature:
+                self._content_cache.move_to_end(path)
+                return KiroToolResult(success=True, data=cached[1])
+
             with open(path, "r", encoding="utf-8") as f:
                 content = f.read()
 
+            self._content_cache[path] = (signature, content)
+            self._content_cache.move_to_end(path)
+            if len(self._content_cache) > _READ_CACHE_SIZE:
+                self._content_cache.popitem(last=False)
+
             return KiroToolResult(success=True, data=content)
-        except Exception as e:
+        except (OSError, UnicodeError) as e:
             return KiroToolResult(success=False, error=str(e))
 
     def append_file(self, path: str, content: str) -> KiroToolResult:
         """Append content to a file using Kiro's fsAppend tool"""
+        self._pending_mode.setdefault(path, "a")
+        self._pending[path].append(content)
+        return self._commit("append", path)
+
+    @contextmanager
+    def batch(self) -> Iterator["KiroFileSystemAdapter"]:
+        """
+        Buffer writes and appends until the outermost batch exits.
+
+        Each path is then written with a single open/write/close instead
+        of one per logical operation. Writes inside a batch report success
+        before reaching disk, so a failed final flush raises WorkflowError.
+        """
+        self._batch_depth += 1
         try:
-            with open(path, "a", encoding="utf-8") as f:
-                f.write(content)
-
-            self._file_operations.append(
-                {"operation": "append", "path": path, "success": True}
-            )
-
-            return KiroToolResult(success=True, data={"path": path})
-        except Exception as e:
-            return KiroToolResult(success=False, error=str(e))
+            yield self
+        except BaseException:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.flush()
+            raise
+
+        self._batch_depth -= 1
+        if not self._batch_depth:
+            result = self.flush()
+            if not result.success:
+                raise WorkflowError(f"Failed to write buffered files: {result.error}")
+
+    def flush(self) -> KiroToolResult:
+        """Write all pending buffered content to disk"""
+        flushed: List[str] = []
+        errors: List[str] = []
+        for path in list(self._pending):
+            try:
+                self._flush_path(path)
+                flushed.append(path)
+            except (OSError, UnicodeError) as e:
+                errors.append(f"{path}: {e}")
+
+        if errors:
+            return KiroToolResult(success=False, data=flushed, error="; ".join(errors))
+        return KiroToolResult(success=True, data=flushed)
+
+    def _commit(self, operation: str, path: str) -> KiroToolResult:
+        """Flush immediately unless batching, then record the operation"""
+        if not self._batch_depth:
+            try:
+                self._flush_path(path)
+            except (OSError, UnicodeError) as e:
+                return KiroToolResult(success=False, error=str(e))
+
+        self._file_operations.append(FileOperation(operation, path))
+        self._version += 1
+
+        return KiroToolResult(success=True, data={"path": path})
+
+    def _flush_path(self, path: str) -> None:
+        """Write the pending buffer of a single path in one call"""
+        chunks = self._pending.pop(path, None)
+        mode = self._pending_mode.pop(path, "w")
+        if chunks is None:
+            return
+
+        self._content_cache.pop(path, None)
+        parent = os.path.dirname(path)
+        self._ensure_directory(parent)
+
+        data = "".join(chunks)
+        try:
+            _write_text(path, mode, data)
+        except FileNotFoundError:
+            # Directory was removed behind our back; recreate and retry once
+            self._dirs_created.discard(parent)
+            self._ensure_directory(parent)
+            _write_text(path, mode, data)
+
+    def _ensure_directory(self, directory: str) -> None:
+        """Create a directory unless this adapter already created it"""
+        if directory and directory not in self._dirs_created:
+            os.makedirs(directory, exist_ok=True)
+            self._dirs_created.add(directory)
 
     def file_exists(self, path: str) -> bool:
         """Check if a file exists"""
-        return Path(path).exists()
+        return path in self._pending or os.path.lexists(path)
+
+    def get_operations_log(self) -> Sequence[Mapping[str, Any]]:
+        """Get a read-only log of file operations performed"""
+        if self._log_view[0] != self._version:
+            self._log_view = (self._version, _records_view(self._file_operations))
+        return self._log_view[1]
 
-    def get_operations_log(self) -> List[Dict[str, Any]]:
-        """Get log of file operations performed"""
-        return self._file_operations.copy()
+    def get_recent(self, n: int) -> List[Dict[str, Any]]:
+        """Get the last n file operations performed"""
+        return _tail(self._file_operations, n)
 
 
 class KiroUserInputAdapter:
     """Adapter for Kiro's user input mechanisms"""
 
     def __init__(self) -> None:
-        self._input_history: List[Dict[str, Any]] = []
+        self._input_history: Deque[InputRequest] = deque(maxlen=_HISTORY_SIZE)
+        self._version = 0
+        # (version, records) last returned by get_input_history
+        self._history_view: Tuple[int, Tuple[Mapping[str, Any], ...]] = (-1, ())
 
     def request_approval(
         self, question: str, reason: str, options: Optional[List[str]] = None
     ) -> KiroToolResult:
         """Request user approval using Kiro's userInput tool"""
-        try:
-            # In actual Kiro environment, this would call the userInput tool
-            # For now, we'll simulate the operation
-            input_request = {
-                "question": question,
-                "reason": reason,
-                "options": options,
-                "timestamp": None,  # Would be set by actual Kiro tool
-            }
+        # In actual Kiro environment, this would call the userInput tool
+        # For now, we'll simulate the operation
+        self._input_history.append(InputRequest(question, reason, options))
+        self._version += 1
 
-            self._input_history.append(input_request)
+        # Simulate user approval for testing
+        return KiroToolResult(success=True, data={"approved": True, "response": "yes"})
 
-            # Simulate user approval for testing
-            return KiroToolResult(
-                success=True, data={"approved": True, "response": "yes"}
-            )
-        except Exception as e:
-            return KiroToolResult(success=False, error=str(e))
+    def get_input_history(self) -> Sequence[Mapping[str, Any]]:
+        """Get a read-only history of user input requests"""
+        if self._history_view[0] != self._version:
+            self._history_view = (self._version, _records_view(self._input_history))
+        return self._history_view[1]
 
-    def get_input_history(self) -> List[Dict[str, Any]]:
-        """Get history of user input requests"""
-        return self._input_history.copy()
+    def get_recent(self, n: int) -> List[Dict[str, Any]]:
+        """Get the last n user input requests"""
+        return _tail(self._input_history, n)
 
 
 class KiroTaskStatusAdapter:
     """Adapter for Kiro's task status management"""
 
     def __init__(self) -> None:
-        self._status_updates: List[Dict[str, Any]] = []
+        self._status_updates: Deque[StatusUpdate] = deque(maxlen=_HISTORY_SIZE)
+        self._version = 0
+        # (version, records) last returned by get_status_updates
+        self._updates_view: Tuple[int, Tuple[Mapping[str, Any], ...]] = (-1, ())
+        # Latest pending status per (task_file_path, task)
+        self._pending_updates: Dict[Tuple[str, str], str] = {}
+        self._pending_since: Optional[float] = None
 
     def update_task_status(
         self, task_file_path: str, task: str, status: str
     ) -> KiroToolResult:
         """Update task status using Kiro's taskStatus tool"""
-        try:
-            # In actual Kiro environment, this would call the taskStatus tool
-            # For now, we'll simulate the operation
-            status_update = {
-                "task_file_path": task_file_path,
-                "task": task,
-                "status": status,
-                "timestamp": None,  # Would be set by actual Kiro tool
-            }
+        # In actual Kiro environment, this would call the taskStatus tool
+        # For now, we'll simulate the operation
+        status_update = StatusUpdate(task_file_path, task, status)
 
-            self._status_updates.append(status_update)
+        self._status_updates.append(status_update)
+        self._version += 1
 
-            return KiroToolResult(success=True, data=status_update)
-        except Exception as e:
-            return KiroToolResult(success=False, error=str(e))
+        return KiroToolResult(success=True, data=asdict(status_update))
 
-    def get_status_updates(self) -> List[Dict[str, Any]]:
-        """Get history of task status updates"""
-        return self._status_updates.copy()
+    def update_task_status_batched(
+        self, task_file_path: str, task: str, status: str
+    ) -> None:
+        """
+        Queue a task status update, keeping only the latest status per task.
+
+        Pending updates are emitted by flush(), which runs automatically
+        once the batch grows too large or too old.
+        """
+        if self._pending_since is None:
+            self._pending_since = time.monotonic()
+        self._pending_updates[(task_file_path, task)] = status
+
+        if (
+            len(self._pending_updates) >= _STATUS_BATCH_SIZE
+            or time.monotonic() - self._pending_since >= _STATUS_BATCH_MAX_AGE
+        ):
+            self.flush()
+
+    def flush(self) -> KiroToolResult:
+        """Emit one status update per task with pending batched updates"""
+        pending = self._pending_updates
+        self._pending_updates = {}
+        self._pending_since = None
+
+        updates = [
+            self.update_task_status(task_file_path, task, status).data
+            for (task_file_path, task), status in pending.items()
+        ]
+        return KiroToolResult(success=True, data=updates)
+
+    def get_status_updates(self) -> Sequence[Mapping[str, Any]]:
+        """Get a read-only history of task status updates"""
+        if self._updates_view[0] != self._version:
+            self._updates_view = (self._version, _records_view(self._status_updates))
+        return self._updates_view[1]
+
+    def get_recent(self, n: int) -> List[Dict[str, Any]]:
+        """Get the last n task status updates"""
+        return _tail(self._status_updates, n)
 
 
 class KiroIntegrationManager:
@@ -155,22 +369,28 @@ class KiroIntegrationManager:
         self.file_system = KiroFileSystemAdapter()
         self.user_input = KiroUserInputAdapter()
         self.task_status = KiroTaskStatusAdapter()
-        self._spec_manager: Optional[SpecManager] = None
-        self._workflow_controller: Optional[WorkflowController] = None
+        self._spec_manager: Optional["SpecManager"] = None
+        self._workflow_controller: Optional["WorkflowController"] = None
+        self._feature_paths: Dict[str, FeaturePaths] = {}
+        self._status_cache: Optional[Dict[str, Any]] = None
+        self._status_versions: Tuple[int, int, int] = (-1, -1, -1)
 
-    def initialize_spec_manager(self, feature_name: str) -> SpecManager:
+    def initialize_spec_manager(self, feature_name: str) -> "SpecManager":
         """Initialize spec manager with Kiro file system integration"""
         if not self._spec_manager:
+            from .spec_manager import SpecManager
+
             # SpecManager expects a Path, not a string
-            base_path = Path(f".kiro/specs/{feature_name}")
-            self._spec_manager = SpecManager(base_path)
+            self._spec_manager = SpecManager(self._paths(feature_name).base)
             # Inject Kiro file system adapter
             self._spec_manager._file_adapter = self.file_system  # type: ignore
         return self._spec_manager
 
-    def initialize_workflow_controller(self, feature_name: str) -> WorkflowController:
+    def initialize_workflow_controller(self, feature_name: str) -> "WorkflowController":
         """Initialize workflow controller with Kiro integration"""
         if not self._workflow_controller:
+            from .workflow_controller import WorkflowController
+
             # WorkflowController expects a feature_name string, not SpecManager
             self._workflow_controller = WorkflowController(feature_name)
             # Inject Kiro adapters
@@ -188,10 +408,11 @@ class KiroIntegrationManager:
             workflow_controller = self.initialize_workflow_controller(feature_name)
 
             # Create the spec and start the workflow
-            spec_created = spec_manager.create(feature_name)
-            workflow_created = workflow_controller.create(
-                feature_name, feature_idea=feature_idea
-            )
+            with self.file_system.batch():
+                spec_created = spec_manager.create(feature_name)
+                workflow_created = workflow_controller.create(
+                    feature_name, feature_idea=feature_idea
+                )
 
             return KiroToolResult(
                 success=spec_created and workflow_created,
@@ -211,7 +432,7 @@ class KiroIntegrationManager:
             spec_manager = self.initialize_spec_manager(feature_name)
 
             # Update task status to in_progress
-            task_file_path = f".kiro/specs/{feature_name}/tasks.md"
+            task_file_path = self._paths(feature_name).tasks_md
             self.task_status.update_task_status(task_file_path, task_id, "in_progress")
 
             # Execute task (this would integrate with actual task execution logic)
@@ -220,51 +441,151 @@ class KiroIntegrationManager:
             # Update task status to completed
             self.task_status.update_task_status(task_file_path, task_id, "completed")
 
+            # Persist any file writes buffered while the task ran
+            flushed = self.file_system.flush()
+            if not flushed.success:
+                return KiroToolResult(success=False, error=flushed.error)
+
             return KiroToolResult(
                 success=True, data={"task_id": task_id, "status": "completed"}
             )
         except Exception as e:
             return KiroToolResult(success=False, error=str(e))
 
+    def bulk_execute(self, feature_name: str, task_ids: List[str]) -> KiroToolResult:
+        """Execute several tasks, coalescing their status updates"""
+        try:
+            self.initialize_spec_manager(feature_name)
+            task_file_path = self._paths(feature_name).tasks_md
+
+            for task_id in task_ids:
+                self.task_status.update_task_status_batched(
+                    task_file_path, task_id, "in_progress"
+                )
+
+            # Execute tasks (this would integrate with actual task execution logic)
+            # For now, we'll simulate successful execution
+
+            for task_id in task_ids:
+                self.task_status.update_task_status_batched(
+                    task_file_path, task_id, "completed"
+                )
+
+            self.task_status.flush()
+            flushed = self.file_system.flush()
+            if not flushed.success:
+                return KiroToolResult(success=False, error=flushed.error)
+
+            return KiroToolResult(
+                success=True,
+                data={"task_ids": list(task_ids), "status": "completed"},
+            )
+        except Exception as e:
+            return KiroToolResult(success=False, error=str(e))
+
+    def _paths(self, feature_name: str) -> FeaturePaths:
+        """Get the cached path set for a feature"""
+        paths = self._feature_paths.get(feature_name)
+        if paths is None:
+            paths = FeaturePaths.for_feature(feature_name)
+            self._feature_paths[feature_name] = paths
+        return paths
+
     def get_integration_status(self) -> Dict[str, Any]:
         """Get status of Kiro integration components"""
-        return {
-            "file_system": {
-                "operations_count": len(self.file_system.get_operations_log()),
-                "last_operations": (
-                    self.file_system.get_operations_log()[-5:]
-                    if self.file_system.get_operations_log()
-                    else []
-                ),
-            },
-            "user_input": {
-                "requests_count": len(self.user_input.get_input_history()),
-                "last_requests": (
-                    self.user_input.get_input_history()[-3:]
-                    if self.user_input.get_input_history()
-                    else []
-                ),
-            },
-            "task_status": {
-                "updates_count": len(self.task_status.get_status_updates()),
-                "last_updates": (
-                    self.task_status.get_status_updates()[-5:]
-                    if self.task_status.get_status_updates()
-                    else []
-                ),
-            },
-        }
-
-
-# Global integration manager instance
-_integration_manager = None
+        file_system = self.file_system
+        user_input = self.user_input
+        task_status = self.task_status
+
+        versions = (file_system._version, user_input._version, task_status._version)
+        if self._status_cache is None or versions != self._status_versions:
+            # Counts come from the version counters, which keep growing after
+            # the bounded histories drop their oldest records. Recent records
+            # are read-only tuples and callers get copies of the section
+            # dicts, so nothing they do reaches the cache
+            self._status_versions = versions
+            self._status_cache = {
+                "file_system": {
+                    "operations_count": file_system._version,
+                    "last_operations": _frozen(file_system.get_recent(5)),
+                },
+                "user_input": {
+                    "requests_count": user_input._version,
+                    "last_requests": _frozen(user_input.get_recent(3)),
+                },
+                "task_status": {
+                    "updates_count": task_status._version,
+                    "last_updates": _frozen(task_status.get_recent(5)),
+                },
+            }
+
+        return {name: dict(section) for name, section in self._status_cache.items()}
+
+
+def _write_text(path: str, mode: str, data: str) -> None:
+    """
+    Write text to a file in a single call.
+
+    Full rewrites go through a temporary file that is atomically renamed
+    over the target, so readers never observe a partially written file.
+    """
+    if mode == "a":
+        with open(path, "a", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as f:
+            f.write(data)
+        return
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        with os.fdopen(fd, "w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+
+
+def _records_view(history: Deque[Any]) -> Tuple[Mapping[str, Any], ...]:
+    """
+    Convert history records to read-only mappings.
+
+    Callers cache the result per adapter version, so the records are only
+    converted again after the history changes.
+    """
+    return tuple(MappingProxyType(asdict(record)) for record in history)
+
+
+def _frozen(records: List[Dict[str, Any]]) -> Tuple[Mapping[str, Any], ...]:
+    """Return record dicts as a tuple of read-only mappings"""
+    return tuple(MappingProxyType(record) for record in records)
+
+
+def _tail(history: Deque[Any], n: int) -> List[Dict[str, Any]]:
+    """Return the last n records of a history deque as dicts"""
+    recent = [asdict(record) for record in islice(reversed(history), n)]
+    recent.reverse()
+    return recent
+
+
+# File adapters with potentially unflushed buffers, flushed at interpreter exit
+_live_file_adapters: "weakref.WeakSet[KiroFileSystemAdapter]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_file_adapters() -> None:
+    """Flush pending writes of all live file adapters"""
+    for adapter in list(_live_file_adapters):
+        adapter.flush()
+
+
+# Global integration manager instance, built at import time since construction
+# performs no I/O; this keeps the accessor lock-free and branch-free
+_integration_manager = KiroIntegrationManager()
 
 
 def get_kiro_integration() -> KiroIntegrationManager:
     """Get the global Kiro integration manager instance"""
-    global _integration_manager
-    if _integration_manager is None:
-        _integration_manager = KiroIntegrationManager()
     return _integration_manager
 
 
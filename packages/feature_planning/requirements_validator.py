@@ -6,10 +6,328 @@ and maintains glossary consistency.
 """
 
 import re
-from typing import Dict, List, Optional, Set
+from collections import OrderedDict, defaultdict
+from functools import lru_cache
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Iterable, List, Optional, Pattern, Set, Tuple
 
 from .base import BaseValidator, QualityIssue, ValidationResult
-from .config import get_config
+from .config import FeaturePlanningConfig, INCOSERuleConfig, get_config
+
+# Precompiled patterns used by the INCOSE rule checks
+# Any measurable indicator: a number, a unit or a quantifier
+_MEASURE_RE = re.compile(
+    r"(?P<number>\d+)"
+    r"|\b(?P<unit>seconds?|minutes?|hours?|days?|ms|kb|mb|gb|%|percent)\b"
+    r"|\b(?P<quantifier>all|every|each|within|less than|greater than"
+    r"|at least|at most)\b",
+    re.IGNORECASE,
+)
+_WORDS_RE = re.compile(r"\b\w+\b")
+# Maps every ASCII non-word character to a space, so that splitting ASCII
+# text yields the same tokens as _WORDS_RE
+_NON_WORD_TO_SPACE = str.maketrans(
+    {chr(c): " " for c in range(128) if not (chr(c).isalnum() or chr(c) == "_")}
+)
+
+# Precompiled patterns used by glossary and completeness checks
+_TECH_RE = re.compile(
+    r"\bTHE\s+(?P<system>[A-Z][a-zA-Z_]+)\s+SHALL\b"
+    r"|\b(?P<acronym>[A-Z]{2,5})\b"
+    r"|\b(?P<camel>[A-Z][a-z]+(?:[A-Z][a-z]+)+)\b"
+    r"|\b(?P<underscore>\w+_\w+)\b"
+)
+_THE_SHALL_RE = re.compile(r"\bthe\s+(\w+)\s+shall\b")
+_WS_RE = re.compile(r"\s+")
+_BOUNDARY_RE = re.compile(r"\b")
+
+# Number of requirement texts whose INCOSE results are kept per validator
+_RESULT_CACHE_SIZE = 1024
+
+# Vague terms to detect
+_VAGUE_TERMS = frozenset(
+    {
+        "quickly",
+        "fast",
+        "slow",
+        "adequate",
+        "sufficient",
+        "appropriate",
+        "reasonable",
+        "easy",
+        "simple",
+        "complex",
+        "good",
+        "bad",
+        "better",
+        "worse",
+        "optimal",
+        "efficient",
+        "robust",
+        "reliable",
+        "secure",
+        "safe",
+        "high",
+        "low",
+        "many",
+        "few",
+        "some",
+        "several",
+        "various",
+        "multiple",
+    }
+)
+
+# Compound vague terms (hyphenated or multi-word)
+_COMPOUND_VAGUE_TERMS = (
+    "user-friendly",
+    "user friendly",
+    "cost-effective",
+    "cost effective",
+    "state-of-the-art",
+    "state of the art",
+    "real-time",
+    "real time",
+)
+
+# Escape clauses to detect
+_ESCAPE_CLAUSES = frozenset(
+    {
+        "where possible",
+        "if possible",
+        "when feasible",
+        "if feasible",
+        "as appropriate",
+        "as needed",
+        "when necessary",
+        "if required",
+        "to the extent possible",
+        "where applicable",
+        "if applicable",
+        "as much as possible",
+        "when practical",
+        "if practical",
+    }
+)
+
+# Passive voice indicators
+_PASSIVE_INDICATORS = frozenset({"is", "are", "was", "were", "been", "being", "be"})
+
+# Performance/quality terms that call for measurable criteria
+_PERFORMANCE_TERMS = frozenset(
+    {
+        "performance",
+        "speed",
+        "time",
+        "response",
+        "throughput",
+        "capacity",
+        "accuracy",
+        "precision",
+    }
+)
+
+# Common words that aren't technical terms
+_COMMON_WORDS = frozenset(
+    {"THE", "SHALL", "WHEN", "WHERE", "WHILE", "IF", "THEN", "AND", "OR"}
+)
+
+
+@lru_cache(maxsize=512)
+def _tokenize(text: str) -> FrozenSet[str]:
+    """Return the set of words in text, memoized across checks."""
+    if text.isascii():
+        return frozenset(text.translate(_NON_WORD_TO_SPACE).split())
+    return frozenset(_WORDS_RE.findall(text))
+
+
+@dataclass
+class _RuleHits:
+    """Matches collected by the fused single-requirement scan."""
+
+    passive: bool = False
+    shall_be: bool = False
+    negatives: List[str] = field(default_factory=list)
+    escape_clauses: List[str] = field(default_factory=list)
+    compound_terms: List[str] = field(default_factory=list)
+    and_count: int = 0
+    or_count: int = 0
+
+
+def _literal_alternation(terms: Iterable[str]) -> str:
+    """
+    Build a regex matching any of the literal terms.
+
+    The terms are factored into a character trie, so the regex engine
+    dispatches on shared prefixes (Aho-Corasick style) instead of retrying
+    every term at each position. Longer terms win over their prefixes.
+    """
+    trie: Dict[str, dict] = {}
+    for term in terms:
+        node = trie
+        for char in term.lower():
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    return _trie_pattern(trie) if trie else "(?!)"
+
+
+def _trie_pattern(node: Dict[str, dict]) -> str:
+    """Render a literal trie node as a regex fragment."""
+    branches = [
+        re.escape(char) + _trie_pattern(child)
+        for char, child in sorted(node.items())
+        if char
+    ]
+    if not branches:
+        return ""
+
+    is_terminal = "" in node
+    if len(branches) == 1 and not is_terminal:
+        return branches[0]
+
+    group = "(?:" + "|".join(branches) + ")"
+    return group + "?" if is_terminal else group
+
+
+def _build_rules_re(
+    escape_clauses: Iterable[str], compound_terms: Iterable[str]
+) -> Pattern[str]:
+    """
+    Build the fused INCOSE rule pattern.
+
+    Every alternative sits inside a lookahead so the scan tests each
+    position without consuming text, which keeps overlapping hits such
+    as "shall be processed" (SHALL-be and passive) both visible.
+    """
+    return re.compile(
+        r"(?=(?P<passive>\b(?:is|are|was|were|be|been|being)\s+\w+ed\b)"
+        r"|(?P<shall_be>\bshall\s+be\s+\w+ed\b)"
+        r"|(?P<negative>\b(?:shall|will|must|should)\s+not\b|\bcannot\b)"
+        rf"|(?P<escape>{_literal_alternation(escape_clauses)})"
+        rf"|(?P<compound>{_literal_alternation(compound_terms)})"
+        r"|\b(?P<and_word>and)\b|\b(?P<or_word>or)\b)",
+        re.IGNORECASE,
+    )
+
+
+# Single-pass pattern for passive voice, negatives, escape clauses,
+# compound vague terms and AND/OR conjunctions
+_RULES_RE = _build_rules_re(_ESCAPE_CLAUSES, _COMPOUND_VAGUE_TERMS)
+
+# Whole-word matchers for the single-word term tables; applied to
+# lowercased text
+_VAGUE_RE = re.compile(rf"\b(?:{_literal_alternation(_VAGUE_TERMS)})\b")
+_PERFORMANCE_RE = re.compile(rf"\b(?:{_literal_alternation(_PERFORMANCE_TERMS)})\b")
+
+# Fixed-text issues, shared between calls (QualityIssue is frozen)
+_ISSUE_TEMPLATES: Dict[str, QualityIssue] = {
+    "not_empty": QualityIssue(
+        rule="not_empty",
+        description="Requirement is empty",
+        suggestion="Provide the requirement text using THE <system> SHALL <response>",
+        severity="error",
+    ),
+    "passive_voice": QualityIssue(
+        rule="active_voice",
+        description="Requirement appears to use passive voice",
+        suggestion="Rewrite using active voice: specify who performs the action",
+        severity="error",
+    ),
+    "shall_be": QualityIssue(
+        rule="active_voice",
+        description="'SHALL be [verb]ed' construction suggests passive voice",
+        suggestion="Use active voice: 'THE [system] SHALL [action]'",
+        severity="error",
+    ),
+    "negative": QualityIssue(
+        rule="no_negatives",
+        description="Negative requirement detected (SHALL NOT, etc.)",
+        suggestion="Rewrite as positive requirement specifying what the system SHALL do",
+        severity="warning",
+    ),
+    "measurable": QualityIssue(
+        rule="measurable",
+        description="Performance requirement lacks measurable criteria",
+        suggestion="Add specific quantities, timeframes, or success conditions",
+        severity="warning",
+    ),
+}
+
+
+@lru_cache(maxsize=256)
+def _vague_term_issue(term: str) -> QualityIssue:
+    """Return the issue for a vague term; terms come from fixed tables."""
+    return QualityIssue(
+        rule="no_vague_terms",
+        description=f"Vague term detected: '{term}'",
+        suggestion=f"Replace '{term}' with specific, measurable criteria",
+        severity="warning",
+    )
+
+
+@lru_cache(maxsize=256)
+def _escape_clause_issue(clause: str) -> QualityIssue:
+    """Return the issue for an escape clause; clauses come from a fixed table."""
+    return QualityIssue(
+        rule="no_escape_clauses",
+        description=f"Escape clause detected: '{clause}'",
+        suggestion=f"Remove '{clause}' and specify exact conditions",
+        severity="error",
+    )
+
+
+@lru_cache(maxsize=1)
+def _incose_rules_for(config: FeaturePlanningConfig) -> Dict[str, INCOSERuleConfig]:
+    """Return the INCOSE rules of config, copied once per config instance."""
+    return config.get_incose_rules()
+
+
+@lru_cache(maxsize=32)
+def _glossary_matcher(
+    terms: Tuple[str, ...]
+) -> Tuple[Pattern[str], Dict[str, Tuple[str, ...]]]:
+    """
+    Build the one-pass matcher for a set of glossary terms.
+
+    The pattern is a zero-width lookahead, so every start position is
+    tried and overlapping terms are all found; the alternation is ordered
+    longest-first and captures the longest term at each position. The
+    returned map lists, for each case-folded term, the shorter terms that
+    are its prefixes and may therefore match at the same position.
+    """
+    keys = sorted({term.lower() for term in terms if term}, key=len, reverse=True)
+    if not keys:
+        return re.compile("(?!)"), {}
+
+    ordered = sorted((term for term in terms if term), key=len, reverse=True)
+    alternation = "|".join(re.escape(term) for term in ordered)
+    pattern = re.compile(rf"(?=(\b(?:{alternation})\b))", re.IGNORECASE)
+    return pattern, _prefix_map(keys)
+
+
+@lru_cache(maxsize=32)
+def _substring_matcher(
+    keys: Tuple[str, ...]
+) -> Tuple[Pattern[str], Dict[str, Tuple[str, ...]]]:
+    """
+    Build a one-pass matcher for lowercase keys occurring anywhere in a
+    lowercased text, including inside longer words.
+
+    Like _glossary_matcher, the lookahead captures the longest key at each
+    position and the prefix map supplies the shorter keys found with it.
+    """
+    pattern = re.compile(f"(?=({_literal_alternation(keys)}))")
+    return pattern, _prefix_map(keys)
+
+
+def _prefix_map(keys: Iterable[str]) -> Dict[str, Tuple[str, ...]]:
+    """Map each key to the other keys that are prefixes of it."""
+    keys = list(keys)
+    return {
+        key: tuple(other for other in keys if other != key and key.startswith(other))
+        for key in keys
+    }
 
 
 class RequirementsValidator(BaseValidator):
@@ -20,84 +338,17 @@ class RequirementsValidator(BaseValidator):
     and maintain measurability and consistency.
     """
 
+    # Term tables shared by all instances
+    vague_terms = _VAGUE_TERMS
+    compound_vague_terms = _COMPOUND_VAGUE_TERMS
+    escape_clauses = _ESCAPE_CLAUSES
+    passive_indicators = _PASSIVE_INDICATORS
+
     def __init__(self) -> None:
         """Initialize Requirements Validator with INCOSE rules."""
         self.config = get_config()
-        self.incose_rules = self.config.get_incose_rules()
-
-        # Vague terms to detect
-        self.vague_terms = {
-            "quickly",
-            "fast",
-            "slow",
-            "adequate",
-            "sufficient",
-            "appropriate",
-            "reasonable",
-            "easy",
-            "simple",
-            "complex",
-            "good",
-            "bad",
-            "better",
-            "worse",
-            "optimal",
-            "efficient",
-            "robust",
-            "reliable",
-            "secure",
-            "safe",
-            "high",
-            "low",
-            "many",
-            "few",
-            "some",
-            "several",
-            "various",
-            "multiple",
-        }
-
-        # Compound vague terms (hyphenated or multi-word)
-        self.compound_vague_terms = [
-            "user-friendly",
-            "user friendly",
-            "cost-effective",
-            "cost effective",
-            "state-of-the-art",
-            "state of the art",
-            "real-time",
-            "real time",
-        ]
-
-        # Escape clauses to detect
-        self.escape_clauses = {
-            "where possible",
-            "if possible",
-            "when feasible",
-            "if feasible",
-            "as appropriate",
-            "as needed",
-            "when necessary",
-            "if required",
-            "to the extent possible",
-            "where applicable",
-            "if applicable",
-            "as much as possible",
-            "when practical",
-            "if practical",
-        }
-
-        # Passive voice indicators
-        self.passive_indicators = {"is", "are", "was", "were", "been", "being", "be"}
-
-        # Negative statement patterns
-        self.negative_patterns = [
-            r"\bshall\s+not\b",
-            r"\bwill\s+not\b",
-            r"\bmust\s+not\b",
-            r"\bcannot\b",
-            r"\bshould\s+not\b",
-        ]
+        self.incose_rules = _incose_rules_for(self.config)
+        self._result_cache: "OrderedDict[str, Tuple[QualityIssue, ...]]" = OrderedDict()
 
     def validate(self, content: str) -> ValidationResult:
         """
@@ -146,134 +397,132 @@ class RequirementsValidator(BaseValidator):
         Returns:
             List of quality issues found
         """
+        # Blank input cannot match any rule; report it without scanning
+        if not requirement.strip():
+            return [_ISSUE_TEMPLATES["not_empty"]]
+
+        cached = self._result_cache.get(requirement)
+        if cached is not None:
+            self._result_cache.move_to_end(requirement)
+            return list(cached)
+
         issues = []
+        text_lower = requirement.lower()
+        hits = self._scan_rules(text_lower)
 
         # Check active voice
-        issues.extend(self._check_active_voice(requirement))
+        issues.extend(self._check_active_voice(hits))
 
         # Check for vague terms
-        issues.extend(self._check_vague_terms(requirement))
+        issues.extend(self._check_vague_terms(text_lower, hits))
 
         # Check for escape clauses
-        issues.extend(self._check_escape_clauses(requirement))
+        issues.extend(self._check_escape_clauses(hits))
 
         # Check for negative statements
-        issues.extend(self._check_negative_statements(requirement))
+        issues.extend(self._check_negative_statements(hits))
 
         # Check for single thought
-        issues.extend(self._check_single_thought(requirement))
+        issues.extend(self._check_single_thought(hits))
 
         # Check measurability
-        issues.extend(self._check_measurability(requirement))
+        issues.extend(self._check_measurability(text_lower))
+
+        self._result_cache[requirement] = tuple(issues)
+        if len(self._result_cache) > _RESULT_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
 
         return issues
 
-    def _check_active_voice(self, requirement: str) -> List[QualityIssue]:
+    def _scan_rules(self, text_lower: str) -> _RuleHits:
+        """Collect all pattern-based rule hits in one pass over the text."""
+        hits = _RuleHits()
+
+        for match in _RULES_RE.finditer(text_lower):
+            kind = match.lastgroup
+            text = match.group(kind)
+
+            if kind == "and_word":
+                hits.and_count += 1
+            elif kind == "or_word":
+                hits.or_count += 1
+            elif kind == "passive":
+                hits.passive = True
+            elif kind == "shall_be":
+                hits.shall_be = True
+            elif kind == "negative":
+                # One hit per negative form (SHALL NOT, CANNOT, ...)
+                form = text.split()[0]
+                if form not in hits.negatives:
+                    hits.negatives.append(form)
+            elif kind == "escape":
+                if text not in hits.escape_clauses:
+                    hits.escape_clauses.append(text)
+            elif text not in hits.compound_terms:
+                hits.compound_terms.append(text)
+
+        return hits
+
+    def _check_active_voice(self, hits: _RuleHits) -> List[QualityIssue]:
         """Check if requirement uses active voice."""
         issues = []
 
-        # Look for passive voice patterns
-        text_lower = requirement.lower()
-
         # Pattern: "be" + past participle (common passive voice)
-        passive_pattern = r"\b(?:is|are|was|were|be|been|being)\s+\w+ed\b"
-        if re.search(passive_pattern, text_lower):
-            issues.append(
-                QualityIssue(
-                    rule="active_voice",
-                    description="Requirement appears to use passive voice",
-                    suggestion="Rewrite using active voice: specify who performs the action",
-                    severity="error",
-                )
-            )
+        if hits.passive:
+            issues.append(_ISSUE_TEMPLATES["passive_voice"])
 
         # Check for "shall be" constructions which are often passive
-        if re.search(r"\bshall\s+be\s+\w+ed\b", text_lower):
-            issues.append(
-                QualityIssue(
-                    rule="active_voice",
-                    description="'SHALL be [verb]ed' construction suggests passive voice",
-                    suggestion="Use active voice: 'THE [system] SHALL [action]'",
-                    severity="error",
-                )
-            )
+        if hits.shall_be:
+            issues.append(_ISSUE_TEMPLATES["shall_be"])
 
         return issues
 
-    def _check_vague_terms(self, requirement: str) -> List[QualityIssue]:
+    def _check_vague_terms(
+        self, text_lower: str, hits: _RuleHits
+    ) -> List[QualityIssue]:
         """Check for vague or subjective terms."""
         issues = []
 
-        # Check individual words
-        words = set(re.findall(r"\b\w+\b", requirement.lower()))
-        found_vague = words.intersection(self.vague_terms)
-        for term in found_vague:
-            issues.append(
-                QualityIssue(
-                    rule="no_vague_terms",
-                    description=f"Vague term detected: '{term}'",
-                    suggestion=f"Replace '{term}' with specific, measurable criteria",
-                    severity="warning",
-                )
-            )
+        # Check individual words, reporting each vague term once
+        seen = set()
+        for match in _VAGUE_RE.finditer(text_lower):
+            term = match.group()
+            if term in seen:
+                continue
+            seen.add(term)
+            issues.append(_vague_term_issue(term))
 
         # Check compound vague terms
-        requirement_lower = requirement.lower()
-        for compound_term in self.compound_vague_terms:
-            if compound_term in requirement_lower:
-                issues.append(
-                    QualityIssue(
-                        rule="no_vague_terms",
-                        description=f"Vague term detected: '{compound_term}'",
-                        suggestion=f"Replace '{compound_term}' with specific, measurable criteria",
-                        severity="warning",
-                    )
-                )
+        for compound_term in hits.compound_terms:
+            issues.append(_vague_term_issue(compound_term))
 
         return issues
 
-    def _check_escape_clauses(self, requirement: str) -> List[QualityIssue]:
+    def _check_escape_clauses(self, hits: _RuleHits) -> List[QualityIssue]:
         """Check for escape clauses that weaken requirements."""
         issues = []
-        text_lower = requirement.lower()
 
-        for clause in self.escape_clauses:
-            if clause in text_lower:
-                issues.append(
-                    QualityIssue(
-                        rule="no_escape_clauses",
-                        description=f"Escape clause detected: '{clause}'",
-                        suggestion=f"Remove '{clause}' and specify exact conditions",
-                        severity="error",
-                    )
-                )
+        for clause in hits.escape_clauses:
+            issues.append(_escape_clause_issue(clause))
 
         return issues
 
-    def _check_negative_statements(self, requirement: str) -> List[QualityIssue]:
+    def _check_negative_statements(self, hits: _RuleHits) -> List[QualityIssue]:
         """Check for negative requirements (SHALL NOT)."""
         issues = []
 
-        for pattern in self.negative_patterns:
-            if re.search(pattern, requirement, re.IGNORECASE):
-                issues.append(
-                    QualityIssue(
-                        rule="no_negatives",
-                        description="Negative requirement detected (SHALL NOT, etc.)",
-                        suggestion="Rewrite as positive requirement specifying what the system SHALL do",
-                        severity="warning",
-                    )
-                )
+        for _ in hits.negatives:
+            issues.append(_ISSUE_TEMPLATES["negative"])
 
         return issues
 
-    def _check_single_thought(self, requirement: str) -> List[QualityIssue]:
+    def _check_single_thought(self, hits: _RuleHits) -> List[QualityIssue]:
         """Check if requirement expresses single thought."""
         issues = []
 
         # Count AND/OR conjunctions that might indicate multiple thoughts
-        and_count = len(re.findall(r"\band\b", requirement, re.IGNORECASE))
-        or_count = len(re.findall(r"\bor\b", requirement, re.IGNORECASE))
+        and_count = hits.and_count
+        or_count = hits.or_count
 
         # More than 2 ANDs or any ORs might indicate multiple thoughts
         if and_count > 2:
@@ -298,51 +547,17 @@ class RequirementsValidator(BaseValidator):
 
         return issues
 
-    def _check_measurability(self, requirement: str) -> List[QualityIssue]:
+    def _check_measurability(self, text_lower: str) -> List[QualityIssue]:
         """Check if requirement includes measurable criteria."""
         issues = []
 
-        # Look for measurable indicators (numbers, units, percentages)
-        has_numbers = bool(re.search(r"\d+", requirement))
-        has_units = bool(
-            re.search(
-                r"\b(?:seconds?|minutes?|hours?|days?|ms|kb|mb|gb|%|percent)\b",
-                requirement,
-                re.IGNORECASE,
-            )
-        )
-        has_quantifiers = bool(
-            re.search(
-                r"\b(?:all|every|each|within|less than|greater than|at least|at most)\b",
-                requirement,
-                re.IGNORECASE,
-            )
-        )
+        # Only requirements with performance/quality terms need measurable
+        # criteria (numbers, units, percentages or quantifiers)
+        if not _PERFORMANCE_RE.search(text_lower):
+            return issues
 
-        # If requirement contains performance/quality terms but no measurable criteria
-        performance_terms = {
-            "performance",
-            "speed",
-            "time",
-            "response",
-            "throughput",
-            "capacity",
-            "accuracy",
-            "precision",
-        }
-        words = set(re.findall(r"\b\w+\b", requirement.lower()))
-
-        if words.intersection(performance_terms) and not (
-            has_numbers or has_units or has_quantifiers
-        ):
-            issues.append(
-                QualityIssue(
-                    rule="measurable",
-                    description="Performance requirement lacks measurable criteria",
-                    suggestion="Add specific quantities, timeframes, or success conditions",
-                    severity="warning",
-                )
-            )
+        if not _MEASURE_RE.search(text_lower):
+            issues.append(_ISSUE_TEMPLATES["measurable"])
 
         return issues
 
@@ -441,7 +656,7 @@ class RequirementsValidator(BaseValidator):
             )
 
         # Check for vague definitions
-        definition_words = set(re.findall(r"\b\w+\b", definition.lower()))
+        definition_words = _tokenize(definition.lower())
         vague_in_definition = definition_words.intersection(self.vague_terms)
         if vague_in_definition:
             issues.append(
@@ -459,32 +674,33 @@ class RequirementsValidator(BaseValidator):
         """Check for circular references in glossary definitions."""
         issues = []
 
-        for term, definition in terms.items():
-            # Check if this term's definition references other terms in the glossary
-            definition_words = set(re.findall(r"\b\w+\b", definition.lower()))
-            other_terms = {t.lower() for t in terms.keys() if t.lower() != term.lower()}
+        # Map lowercase terms back to their first-seen spelling
+        lower_to_original: Dict[str, str] = {}
+        for term in terms:
+            lower_to_original.setdefault(term.lower(), term)
+        lower_terms = frozenset(lower_to_original)
+
+        # Reverse index: term -> other glossary terms its definition mentions
+        references = {
+            term: (_tokenize(definition.lower()) & lower_terms) - {term.lower()}
+            for term, definition in terms.items()
+        }
 
-            referenced_terms = definition_words.intersection(other_terms)
+        for term, referenced_terms in references.items():
+            term_lower = term.lower()
 
-            # For each referenced term, check if it references back
+            # A reference is circular if the referenced term points back
             for ref_term in referenced_terms:
-                # Find the actual term key (case-sensitive)
-                actual_ref_term = next(
-                    (t for t in terms.keys() if t.lower() == ref_term), None
-                )
-                if actual_ref_term:
-                    ref_definition = terms[actual_ref_term]
-                    ref_def_words = set(re.findall(r"\b\w+\b", ref_definition.lower()))
-
-                    if term.lower() in ref_def_words:
-                        issues.append(
-                            QualityIssue(
-                                rule="glossary_circular",
-                                description=f"Circular reference between '{term}' and '{actual_ref_term}'",
-                                suggestion="Rewrite definitions to avoid circular references",
-                                severity="warning",
-                            )
+                actual_ref_term = lower_to_original[ref_term]
+                if term_lower in references[actual_ref_term]:
+                    issues.append(
+                        QualityIssue(
+                            rule="glossary_circular",
+                            description=f"Circular reference between '{term}' and '{actual_ref_term}'",
+                            suggestion="Rewrite definitions to avoid circular references",
+                            severity="warning",
                         )
+                    )
 
         return issues
 
@@ -504,46 +720,21 @@ class RequirementsValidator(BaseValidator):
         if existing_glossary is None:
             existing_glossary = {}
 
+        existing_lower = {term.lower() for term in existing_glossary.keys()}
         detected_terms = set()
 
-        # Look for capitalized terms that might be system names
-        system_names = re.findall(
-            r"\bTHE\s+([A-Z][a-zA-Z_]+)\s+SHALL\b", requirements_text
-        )
-        detected_terms.update(system_names)
-
-        # Look for technical acronyms (2-5 uppercase letters)
-        acronyms = re.findall(r"\b[A-Z]{2,5}\b", requirements_text)
-        detected_terms.update(acronyms)
-
-        # Look for compound technical terms (words with underscores or CamelCase)
-        compound_terms = re.findall(
-            r"\b[A-Z][a-z]+(?:[A-Z][a-z]+)+\b", requirements_text
-        )
-        detected_terms.update(compound_terms)
-
-        underscore_terms = re.findall(r"\b\w+_\w+\b", requirements_text)
-        detected_terms.update(underscore_terms)
+        # One pass for system names (THE X SHALL), acronyms (2-5 uppercase
+        # letters), CamelCase and underscore compound terms
+        for match in _TECH_RE.finditer(requirements_text):
+            term = match.group(match.lastgroup)
 
-        # Filter out terms already in glossary (case-insensitive)
-        existing_lower = {term.lower() for term in existing_glossary.keys()}
-        detected_terms = {
-            term for term in detected_terms if term.lower() not in existing_lower
-        }
-
-        # Filter out common words that aren't technical terms
-        common_words = {
-            "THE",
-            "SHALL",
-            "WHEN",
-            "WHERE",
-            "WHILE",
-            "IF",
-            "THEN",
-            "AND",
-            "OR",
-        }
-        detected_terms = {term for term in detected_terms if term not in common_words}
+            # Skip repeats, common words and terms already in glossary
+            # (case-insensitive)
+            if term in detected_terms or term in _COMMON_WORDS:
+                continue
+            if term.lower() in existing_lower:
+                continue
+            detected_terms.add(term)
 
         return detected_terms
 
@@ -573,12 +764,44 @@ class RequirementsValidator(BaseValidator):
                 "Add definitions for technical terms used in requirements"
             )
 
-        # Check if glossary terms are actually used in requirements
-        requirements_lower = requirements_text.lower()
-        unused_terms = []
-        for term in glossary.keys():
-            if term.lower() not in requirements_lower:
-                unused_terms.append(term)
+        # Find every glossary term occurrence in one pass, bucketing the
+        # spellings seen by case-folded term
+        pattern, prefixes = _glossary_matcher(tuple(glossary))
+        variations: Dict[str, Set[str]] = defaultdict(set)
+        folded: Dict[str, str] = {}
+        for match in pattern.finditer(requirements_text):
+            found = match.group(1)
+            key = folded.get(found)
+            if key is None:
+                key = folded[found] = found.lower()
+            variations[key].add(found)
+            start = match.start()
+            for shorter in prefixes.get(key, ()):
+                end = start + len(shorter)
+                if _BOUNDARY_RE.match(requirements_text, end):
+                    variations[shorter].add(requirements_text[start:end])
+
+        # Check if glossary terms are actually used in requirements; terms
+        # without a whole-word hit may still be embedded in longer words,
+        # which one substring pass over the lowercased text settles
+        missing = {
+            term.lower() for term in glossary if term and term.lower() not in variations
+        }
+        embedded: Set[str] = set()
+        if missing:
+            pattern, prefixes = _substring_matcher(tuple(sorted(missing)))
+            for match in pattern.finditer(requirements_text.lower()):
+                found = match.group(1)
+                embedded.add(found)
+                embedded.update(prefixes[found])
+                if len(embedded) == len(missing):
+                    break
+
+        unused_terms = [
+            term
+            for term in glossary
+            if term.lower() in missing and term.lower() not in embedded
+        ]
 
         if unused_terms:
             issues.append(
@@ -589,12 +812,8 @@ class RequirementsValidator(BaseValidator):
             )
 
         # Check for inconsistent term usage (different capitalizations)
-        for term in glossary.keys():
-            # Find all variations of this term in requirements
-            variations = re.findall(
-                rf"\b{re.escape(term)}\b", requirements_text, re.IGNORECASE
-            )
-            unique_variations = set(variations)
+        for term in glossary:
+            unique_variations = variations.get(term.lower(), ())
 
             if len(unique_variations) > 1:
                 issues.append(
@@ -628,26 +847,34 @@ class RequirementsValidator(BaseValidator):
                 is_valid=False, issues=issues, suggestions=suggestions
             )
 
-        # Check for duplicate requirements
+        # Check for duplicate requirements and missing SHALL in one pass;
+        # the SHALL findings are reported after the duplicates
         seen_requirements = set()
-        for i, req in enumerate(requirements):
-            normalized = re.sub(r"\s+", " ", req.strip().lower())
+        lowered_requirements = []
+        shall_issues = []
+        for i, req in enumerate(requirements, 1):
+            lowered = req.lower()
+            lowered_requirements.append(lowered)
+
+            normalized = _WS_RE.sub(" ", lowered.strip())
             if normalized in seen_requirements:
-                issues.append(f"Duplicate requirement detected at position {i+1}")
+                issues.append(f"Duplicate requirement detected at position {i}")
                 suggestions.append("Remove or consolidate duplicate requirements")
-            seen_requirements.add(normalized)
+            else:
+                seen_requirements.add(normalized)
 
-        # Check for requirements without SHALL
-        for i, req in enumerate(requirements):
-            if "shall" not in req.lower():
-                issues.append(f"Requirement {i+1} missing 'SHALL' keyword")
-                suggestions.append(
-                    "All requirements should use 'SHALL' to indicate mandatory behavior"
-                )
+            if "shall" not in lowered:
+                shall_issues.append(f"Requirement {i} missing 'SHALL' keyword")
+
+        issues.extend(shall_issues)
+        suggestions.extend(
+            "All requirements should use 'SHALL' to indicate mandatory behavior"
+            for _ in shall_issues
+        )
 
         # Check for consistent terminology
-        all_text = " ".join(requirements).lower()
-        system_terms = re.findall(r"\bthe\s+(\w+)\s+shall\b", all_text)
+        all_text = " ".join(lowered_requirements)
+        system_terms = _THE_SHALL_RE.findall(all_text)
         if len(set(system_terms)) > 3:
             suggestions.append(
                 "Consider using consistent system names across requirements"
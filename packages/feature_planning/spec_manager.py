@@ -5,13 +5,19 @@ This module handles specification document creation, versioning,
 and file system operations within the Kiro framework.
 """
 
+import errno
 import json
 import os
 import re
 import shutil
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional, Tuple, Union
 
 from .base import BaseManager, WorkflowPhase
 from .config import get_config
@@ -22,6 +28,222 @@ from .error_handling import (
     with_error_handling
 )
 
+# Precompiled patterns used by kebab-case name normalization
+_SEPARATORS_RE = re.compile(r"[\s_]+")
+_NON_KEBAB_RE = re.compile(r"[^a-z0-9-]")
+_DASHES_RE = re.compile(r"-+")
+
+# Backup filename timestamps: YYYYmmdd_HHMMSS with optional _microseconds
+_BACKUP_TIMESTAMP_RE = re.compile(
+    r"(\d{4})(\d{2})(\d{2})_(\d{2})(\d{2})(\d{2})(?:_(\d{1,6}))?"
+)
+
+# Files every specification directory must contain
+_REQUIRED_SPEC_FILES = frozenset({"requirements.md", "design.md", "tasks.md"})
+_REQUIRED_METADATA_FIELDS = ("feature_name", "created_at", "current_phase")
+# Files copied into a version snapshot, documents first
+_SNAPSHOT_FILES = ("requirements.md", "design.md", "tasks.md", "metadata.json")
+
+# Sidecar holding the frequently rewritten last_modified value, so that
+# timestamp updates do not rewrite metadata.json
+_TIMESTAMP_FILE = "metadata.timestamp"
+_PATH_CACHE_SIZE = 1024
+
+# list_versions reads version_info.json files in parallel from this many
+# versions on
+_PREFETCH_MIN_VERSIONS = 8
+_PREFETCH_WORKERS = 4
+
+# Initial document templates, kept as bytes so creating a specification
+# writes them without building or encoding any strings
+_REQUIREMENTS_TEMPLATE = b"""# Requirements Document
+
+## Introduction
+
+[Summary of the feature/system]
+
+## Glossary
+
+- **System/Term**: [Definition]
+
+## Requirements
+
+### Requirement 1
+
+**User Story:** As a [role], I want [feature], so that [benefit]
+
+#### Acceptance Criteria
+
+1. WHEN [event], THE [System_Name] SHALL [response]
+2. WHILE [state], THE [System_Name] SHALL [response]
+3. IF [undesired event], THEN THE [System_Name] SHALL [response]
+"""
+
+_DESIGN_TEMPLATE = b"""# Design Document
+
+## Overview
+
+[System overview and purpose]
+
+## Architecture
+
+[System architecture description]
+
+## Components and Interfaces
+
+[Component specifications]
+
+## Data Models
+
+[Data structure definitions]
+
+## Error Handling
+
+[Error handling strategy]
+
+## Testing Strategy
+
+[Testing approach and methods]
+"""
+
+_TASKS_TEMPLATE = b"""# Implementation Plan
+
+- [ ] 1. [First major task]
+  - [Task details and requirements]
+  - _Requirements: [requirement references]_
+
+- [ ] 2. [Second major task]
+- [ ] 2.1 [Sub-task]
+  - [Sub-task details]
+  - _Requirements: [requirement references]_
+"""
+
+_INITIAL_DOCUMENTS = (
+    ("requirements.md", _REQUIREMENTS_TEMPLATE),
+    ("design.md", _DESIGN_TEMPLATE),
+    ("tasks.md", _TASKS_TEMPLATE),
+)
+
+# Shared encoder for the indented JSON files kept next to the documents;
+# json.dumps(..., indent=2) would build a new encoder on every call
+_JSON_ENCODER = json.JSONEncoder(indent=2)
+
+# (epoch second, formatted stamp) last produced by _file_timestamp
+_timestamp_cache: Tuple[int, str] = (-1, "")
+
+
+def _write_file(
+    path: Union[str, Path], content: Union[str, bytes], exclusive: bool = False
+) -> None:
+    """
+    Replace a file's contents with one write on an unbuffered file.
+
+    Text is encoded up front (bytes are written as they are) through a raw
+    (unbuffered) binary file, so the usual buffered text-file chain becomes
+    a single write() call for document-sized data. With exclusive=True an existing
+    file is left alone; mode "x" makes the open itself the existence check.
+    """
+    try:
+        f = open(path, "xb" if exclusive else "wb", buffering=0)
+    except FileExistsError:
+        if exclusive:
+            return
+        raise
+
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    data = memoryview(content)
+    with f:
+        while data:
+            data = data[f.write(data) :]
+
+
+def _file_timestamp(microseconds: bool = False) -> str:
+    """
+    Return the local time as YYYYmmdd_HHMMSS, optionally with _microseconds.
+
+    The formatted seconds are reused until the clock moves to the next
+    second, so back-to-back backups only format the microsecond suffix.
+    """
+    global _timestamp_cache
+
+    seconds, nanoseconds = divmod(time.time_ns(), 1_000_000_000)
+    cached_seconds, stamp = _timestamp_cache
+    if cached_seconds != seconds:
+        stamp = time.strftime("%Y%m%d_%H%M%S", time.localtime(seconds))
+        _timestamp_cache = (seconds, stamp)
+
+    if microseconds:
+        return f"{stamp}_{nanoseconds // 1000:06d}"
+    return stamp
+
+
+def _read_json(path: Union[str, Path]) -> Any:
+    """
+    Parse a JSON file read as bytes from an unbuffered file.
+
+    json.loads takes the UTF-8 bytes directly, which skips the text-mode
+    decoding layer that json.load reads through.
+    """
+    with open(path, "rb", buffering=0) as f:
+        return json.loads(f.readall())
+
+
+def _read_version_info(version_dir: str) -> Optional[Dict[str, Any]]:
+    """
+    Load a version directory's version_info.json, tagged with the directory.
+
+    Returns None when the info file is missing or is not valid JSON.
+    """
+    try:
+        version_info = _read_json(os.path.join(version_dir, "version_info.json"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    version_info["directory"] = version_dir
+    return version_info
+
+
+def _fingerprint(path: Path) -> Tuple[int, int]:
+    """Return a file's (size, mtime in ns)."""
+    stat = os.stat(path)
+    return (stat.st_size, stat.st_mtime_ns)
+
+
+def _same_content(first: Path, second: Path) -> bool:
+    """
+    Check whether two files hold the same bytes.
+
+    Backups keep their source's mtime, so differing fingerprints settle
+    the common case with two stats; matching ones are confirmed by
+    comparing the contents.
+    """
+    try:
+        if _fingerprint(first) != _fingerprint(second):
+            return False
+        with open(first, "rb") as a, open(second, "rb") as b:
+            return a.read() == b.read()
+    except FileNotFoundError:
+        return False
+
+
+def _snapshot_file(
+    source: Union[str, Path], destination: Union[str, Path], keep_stats: bool = True
+) -> None:
+    """
+    Copy a file for a backup or version snapshot.
+
+    The copy is a regular one, which shutil does with sendfile on Linux.
+    Hard links are not an option: documents are rewritten in place by
+    update(), restores and editors, which would change the backups too.
+    Backups keep the source's stats (restores compare them); version
+    snapshots carry their own created_at and skip the copystat with
+    keep_stats=False.
+    """
+    if keep_stats:
+        shutil.copy2(source, destination)
+    else:
+        shutil.copyfile(source, destination)
+
 
 class SpecManager(BaseManager):
     """
@@ -39,6 +261,17 @@ class SpecManager(BaseManager):
         )
         # Kiro file system adapter (injected by KiroIntegrationManager)
         self._file_adapter = None
+        # Parsed metadata.json files keyed by path, tagged with the
+        # (st_mtime_ns, st_size) they were parsed at
+        self._metadata_cache: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+        # Spec paths keyed by (feature name, file name), tagged with the
+        # base_path they were joined under
+        self._path_cache: Dict[Tuple[str, Optional[str]], Tuple[Path, Path]] = {}
+        # Backup directories this manager has created, keyed by path
+        self._backup_dirs: Dict[str, Path] = {}
+        # Retained backup paths, oldest first, keyed by (backup directory,
+        # document type)
+        self._retained_backups: Dict[Tuple[str, str], Deque[str]] = {}
 
     def create(self, name: str, **kwargs: Any) -> bool:
         """
@@ -67,15 +300,17 @@ class SpecManager(BaseManager):
 
             # Save metadata
             metadata_file = spec_dir / "metadata.json"
-            metadata_content = json.dumps(metadata, indent=2)
+            metadata_content = _JSON_ENCODER.encode(metadata)
             
+            self._metadata_cache.pop(str(metadata_file), None)
+            with suppress(FileNotFoundError):
+                os.unlink(spec_dir / _TIMESTAMP_FILE)
             if self._file_adapter:
                 result = self._file_adapter.write_file(str(metadata_file), metadata_content)
                 if not result.success:
                     raise Exception(f"Kiro file write failed: {result.error}")
             else:
-                with open(metadata_file, "w") as f:
-                    f.write(metadata_content)
+                _write_file(metadata_file, metadata_content)
 
             return True
 
@@ -101,25 +336,30 @@ class SpecManager(BaseManager):
             Dictionary containing all spec documents or None if not found
         """
         try:
-            kebab_name = self._to_kebab_case(name)
-            spec_dir = self.base_path / kebab_name
+            spec_dir = self._spec_path(name)
 
-            if not spec_dir.exists():
+            if not os.path.isdir(spec_dir):
                 return None
 
             # Load metadata
-            metadata_file = spec_dir / "metadata.json"
-            metadata = {}
-            if metadata_file.exists():
-                with open(metadata_file, "r") as f:
-                    metadata = json.load(f)
+            metadata_file = self._spec_path(name, "metadata.json")
+            try:
+                # Callers own the returned metadata; a fresh parse is cheaper
+                # than deep-copying the cached one
+                metadata = _read_json(metadata_file)
+            except FileNotFoundError:
+                metadata = {}
+            else:
+                last_modified = self._read_timestamp(spec_dir)
+                if last_modified is not None and isinstance(metadata, dict):
+                    metadata["last_modified"] = last_modified
 
             # Load documents
             documents: Dict[str, Optional[str]] = {}
             for doc_type in ["requirements", "design", "tasks"]:
-                doc_file = spec_dir / f"{doc_type}.md"
+                doc_file = self._spec_path(name, f"{doc_type}.md")
                 if doc_file.exists():
-                    with open(doc_file, "r") as f:
+                    with open(doc_file, "r", encoding="utf-8") as f:
                         documents[doc_type] = f.read()
                 else:
                     documents[doc_type] = None
@@ -158,10 +398,9 @@ class SpecManager(BaseManager):
                     "Content must be dict with 'document_type' and 'content' keys"
                 )
 
-            kebab_name = self._to_kebab_case(name)
-            spec_dir = self.base_path / kebab_name
+            spec_dir = self._spec_path(name)
 
-            if not spec_dir.exists():
+            if not os.path.isdir(spec_dir):
                 return False
 
             document_type = content["document_type"]
@@ -177,26 +416,25 @@ class SpecManager(BaseManager):
 
             # Update document
             if document_type == "metadata":
-                metadata_file = spec_dir / "metadata.json"
-                content = json.dumps(document_content, indent=2)
+                metadata_file = self.get_document_path(name, document_type)
+                content = _JSON_ENCODER.encode(document_content)
                 
+                self._metadata_cache.pop(str(metadata_file), None)
                 if self._file_adapter:
                     result = self._file_adapter.write_file(str(metadata_file), content)
                     if not result.success:
                         raise Exception(f"Kiro file write failed: {result.error}")
                 else:
-                    with open(metadata_file, "w") as f:
-                        f.write(content)
+                    _write_file(metadata_file, content)
             else:
-                doc_file = spec_dir / f"{document_type}.md"
+                doc_file = self.get_document_path(name, document_type)
                 
                 if self._file_adapter:
                     result = self._file_adapter.write_file(str(doc_file), document_content)
                     if not result.success:
                         raise Exception(f"Kiro file write failed: {result.error}")
                 else:
-                    with open(doc_file, "w") as f:
-                        f.write(document_content)
+                    _write_file(doc_file, document_content)
 
             # Update metadata timestamp
             self._update_metadata_timestamp(spec_dir)
@@ -219,19 +457,23 @@ class SpecManager(BaseManager):
         """
         try:
             kebab_name = self._to_kebab_case(name)
-            spec_dir = self.base_path / kebab_name
+            spec_dir = self._spec_path(name)
 
-            if not spec_dir.exists():
+            if not os.path.isdir(spec_dir):
                 return False
 
-            # Create final backup before deletion
-            backup_dir = self._create_backup_directory(kebab_name)
+            # Move the specification into its final backup; a rename on the
+            # same filesystem copies no data
+            backup_dir = self._create_backup_directory(kebab_name, refresh=True)
             if backup_dir:
-                shutil.copytree(
-                    spec_dir,
-                    backup_dir
-                    / f"final_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-                )
+                final_backup = backup_dir / f"final_backup_{_file_timestamp()}"
+                try:
+                    os.rename(spec_dir, final_backup)
+                    return True
+                except OSError as e:
+                    if e.errno != errno.EXDEV:
+                        raise
+                    shutil.copytree(spec_dir, final_backup)
 
             # Remove directory and all contents
             shutil.rmtree(spec_dir)
@@ -279,13 +521,9 @@ class SpecManager(BaseManager):
         """
         try:
             kebab_name = self._to_kebab_case(feature_name)
-            spec_dir = self.base_path / kebab_name
 
             # Get source document path
-            if document_type == "metadata":
-                source_file = spec_dir / "metadata.json"
-            else:
-                source_file = spec_dir / f"{document_type}.md"
+            source_file = self.get_document_path(feature_name, document_type)
 
             if not source_file.exists():
                 return False
@@ -296,15 +534,25 @@ class SpecManager(BaseManager):
                 return False
 
             # Create timestamped backup with microsecond precision
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+            timestamp = _file_timestamp(microseconds=True)
             backup_filename = f"{document_type}_{timestamp}.backup"
             backup_file = backup_dir / backup_filename
 
             # Copy file to backup location
-            shutil.copy2(source_file, backup_file)
+            try:
+                _snapshot_file(source_file, backup_file)
+            except FileNotFoundError:
+                # The backup directory was removed after it was created
+                backup_dir = self._create_backup_directory(kebab_name, refresh=True)
+                if not backup_dir:
+                    return False
+                backup_file = backup_dir / backup_filename
+                _snapshot_file(source_file, backup_file)
 
             # Maintain backup history (keep last 10 backups per document type)
-            self._cleanup_old_backups(backup_dir, document_type, max_backups=10)
+            self._cleanup_old_backups(
+                backup_dir, document_type, max_backups=10, new_backup=backup_file
+            )
 
             return True
 
@@ -322,39 +570,8 @@ class SpecManager(BaseManager):
         Returns:
             True if structure is valid
         """
-        try:
-            kebab_name = self._to_kebab_case(feature_name)
-            spec_dir = self.base_path / kebab_name
-
-            # Check if directory exists
-            if not spec_dir.exists() or not spec_dir.is_dir():
-                return False
-
-            # Check for required files
-            required_files = ["requirements.md", "design.md", "tasks.md"]
-            for file_name in required_files:
-                file_path = spec_dir / file_name
-                if not file_path.exists():
-                    return False
-
-            # Check metadata file
-            metadata_file = spec_dir / "metadata.json"
-            if metadata_file.exists():
-                try:
-                    with open(metadata_file, "r") as f:
-                        metadata = json.load(f)
-                    # Validate required metadata fields
-                    required_fields = ["feature_name", "created_at", "current_phase"]
-                    for field in required_fields:
-                        if field not in metadata:
-                            return False
-                except json.JSONDecodeError:
-                    return False
-
-            return True
-
-        except Exception:
-            return False
+        kebab_name = self._to_kebab_case(feature_name)
+        return self._is_valid_spec_dir(os.path.join(self.base_path, kebab_name))
 
     def list_specifications(self) -> List[str]:
         """
@@ -364,19 +581,69 @@ class SpecManager(BaseManager):
             List of specification names
         """
         try:
-            if not self.base_path.exists():
+            if not os.path.isdir(self.base_path):
                 return []
 
             specs = []
-            for item in self.base_path.iterdir():
-                if item.is_dir() and self.validate_structure(item.name):
-                    specs.append(item.name)
+            with os.scandir(self.base_path) as entries:
+                for entry in entries:
+                    if not entry.is_dir():
+                        continue
+                    # Names are validated under their kebab-case directory
+                    kebab_name = self._to_kebab_case(entry.name)
+                    spec_dir = (
+                        entry.path
+                        if kebab_name == entry.name
+                        else os.path.join(self.base_path, kebab_name)
+                    )
+                    if self._is_valid_spec_dir(spec_dir):
+                        specs.append(entry.name)
 
             return sorted(specs)
 
         except Exception:
             return []
 
+    def _is_valid_spec_dir(self, spec_dir: str) -> bool:
+        """
+        Check a specification directory's files and metadata.
+
+        The directory is listed once, so required-file presence costs a
+        single scandir instead of one stat per file, and metadata.json is
+        only opened when the listing contains it.
+
+        Args:
+            spec_dir: Specification directory path
+
+        Returns:
+            True if structure is valid
+        """
+        try:
+            with os.scandir(spec_dir) as entries:
+                names = {entry.name for entry in entries}
+
+            # Check for required files
+            if not _REQUIRED_SPEC_FILES <= names:
+                return False
+
+            # Check metadata file
+            if "metadata.json" in names:
+                try:
+                    metadata = self._load_metadata(
+                        os.path.join(spec_dir, "metadata.json")
+                    )
+                    # Validate required metadata fields
+                    for field in _REQUIRED_METADATA_FIELDS:
+                        if field not in metadata:
+                            return False
+                except json.JSONDecodeError:
+                    return False
+
+            return True
+
+        except Exception:
+            return False
+
     def get_document_path(self, feature_name: str, document_type: str) -> Path:
         """
         Get path to specific document.
@@ -388,15 +655,41 @@ class SpecManager(BaseManager):
         Returns:
             Path to document file
         """
-        kebab_name = self._to_kebab_case(feature_name)
-        spec_dir = self.base_path / kebab_name
-
         if document_type == "metadata":
-            return spec_dir / "metadata.json"
+            return self._spec_path(feature_name, "metadata.json")
         else:
-            return spec_dir / f"{document_type}.md"
+            return self._spec_path(feature_name, f"{document_type}.md")
 
-    def _to_kebab_case(self, name: str) -> str:
+    def _spec_path(self, feature_name: str, filename: Optional[str] = None) -> Path:
+        """
+        Get a specification directory, or a file inside it, from the cache.
+
+        Entries are rebuilt when base_path has been reassigned since they
+        were joined.
+
+        Args:
+            feature_name: Feature name
+            filename: Optional file name inside the specification directory
+
+        Returns:
+            Path to the specification directory or file
+        """
+        key = (feature_name, filename)
+        cached = self._path_cache.get(key)
+        if cached is not None and cached[0] is self.base_path:
+            return cached[1]
+
+        path = self.base_path / self._to_kebab_case(feature_name)
+        if filename is not None:
+            path = path / filename
+        if len(self._path_cache) >= _PATH_CACHE_SIZE:
+            self._path_cache.clear()
+        self._path_cache[key] = (self.base_path, path)
+        return path
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _to_kebab_case(name: str) -> str:
         """
         Convert name to kebab-case format.
 
@@ -407,13 +700,13 @@ class SpecManager(BaseManager):
             Kebab-case formatted name
         """
         # Replace spaces and underscores with hyphens
-        name = re.sub(r"[\s_]+", "-", name)
+        name = _SEPARATORS_RE.sub("-", name)
         # Convert to lowercase
         name = name.lower()
         # Remove any non-alphanumeric characters except hyphens
-        name = re.sub(r"[^a-z0-9-]", "", name)
+        name = _NON_KEBAB_RE.sub("", name)
         # Remove multiple consecutive hyphens
-        name = re.sub(r"-+", "-", name)
+        name = _DASHES_RE.sub("-", name)
         # Remove leading/trailing hyphens
         name = name.strip("-")
 
@@ -426,120 +719,116 @@ class SpecManager(BaseManager):
         Args:
             spec_dir: Specification directory path
         """
-        # Create requirements.md template
-        requirements_template = """# Requirements Document
-
-## Introduction
-
-[Summary of the feature/system]
-
-## Glossary
-
-- **System/Term**: [Definition]
-
-## Requirements
+        for filename, content in _INITIAL_DOCUMENTS:
+            _write_file(spec_dir / filename, content, exclusive=True)
 
-### Requirement 1
-
-**User Story:** As a [role], I want [feature], so that [benefit]
-
-#### Acceptance Criteria
-
-1. WHEN [event], THE [System_Name] SHALL [response]
-2. WHILE [state], THE [System_Name] SHALL [response]
-3. IF [undesired event], THEN THE [System_Name] SHALL [response]
-"""
-
-        # Create design.md template
-        design_template = """# Design Document
-
-## Overview
-
-[System overview and purpose]
-
-## Architecture
-
-[System architecture description]
-
-## Components and Interfaces
-
-[Component specifications]
-
-## Data Models
+    def _update_metadata_timestamp(self, spec_dir: Path) -> None:
+        """
+        Update the last modified timestamp in the metadata sidecar.
 
-[Data structure definitions]
+        Args:
+            spec_dir: Specification directory path
+        """
+        try:
+            metadata_file = spec_dir / "metadata.json"
+            timestamp_file = spec_dir / _TIMESTAMP_FILE
+            timestamp = datetime.now().isoformat()
+            # Go through the adapter the metadata was written with, which
+            # knows about metadata it has buffered but not yet written
+            if self._file_adapter:
+                if self._file_adapter.file_exists(str(metadata_file)):
+                    self._file_adapter.write_file(str(timestamp_file), timestamp)
+            elif metadata_file.exists():
+                _write_file(timestamp_file, timestamp)
+        except Exception:
+            pass  # Fail silently for metadata updates
 
-## Error Handling
+    def _read_timestamp(self, spec_dir: Path) -> Optional[str]:
+        """
+        Read the last modified timestamp sidecar.
 
-[Error handling strategy]
+        Args:
+            spec_dir: Specification directory path
 
-## Testing Strategy
+        Returns:
+            ISO timestamp, or None if the specification was never updated
+        """
+        try:
+            with open(spec_dir / _TIMESTAMP_FILE, "r", encoding="utf-8") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
 
-[Testing approach and methods]
-"""
+    def _load_metadata(self, metadata_file: Union[str, Path]) -> Any:
+        """
+        Load a parsed metadata file, reusing the cached parse while the
+        file's mtime and size are unchanged.
 
-        # Create tasks.md template
-        tasks_template = """# Implementation Plan
+        The returned object is shared with the cache and must not be
+        mutated; copy it before making changes.
 
-- [ ] 1. [First major task]
-  - [Task details and requirements]
-  - _Requirements: [requirement references]_
+        Args:
+            metadata_file: Path to metadata JSON file
 
-- [ ] 2. [Second major task]
-- [ ] 2.1 [Sub-task]
-  - [Sub-task details]
-  - _Requirements: [requirement references]_
-"""
+        Returns:
+            Parsed metadata
+        """
+        key = os.fspath(metadata_file)
+        stat = os.stat(key)
+        signature = (stat.st_mtime_ns, stat.st_size)
 
-        # Write template files if they don't exist
-        templates = {
-            "requirements.md": requirements_template,
-            "design.md": design_template,
-            "tasks.md": tasks_template,
-        }
+        cached = self._metadata_cache.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
 
-        for filename, content in templates.items():
-            file_path = spec_dir / filename
-            if not file_path.exists():
-                with open(file_path, "w") as f:
-                    f.write(content)
+        metadata = _read_json(key)
+        self._metadata_cache[key] = (signature, metadata)
+        return metadata
 
-    def _update_metadata_timestamp(self, spec_dir: Path) -> None:
+    def _store_metadata(self, metadata_file: Path, metadata: Dict[str, Any]) -> None:
         """
-        Update the last modified timestamp in metadata.
+        Write metadata to disk and keep it as the cached parse.
 
         Args:
-            spec_dir: Specification directory path
+            metadata_file: Path to metadata JSON file
+            metadata: Metadata to write; must not be mutated afterwards
         """
-        try:
-            metadata_file = spec_dir / "metadata.json"
-            if metadata_file.exists():
-                with open(metadata_file, "r") as f:
-                    metadata = json.load(f)
-
-                metadata["last_modified"] = datetime.now().isoformat()
+        key = os.fspath(metadata_file)
+        self._metadata_cache.pop(key, None)
+        _write_file(key, _JSON_ENCODER.encode(metadata))
 
-                with open(metadata_file, "w") as f:
-                    json.dump(metadata, f, indent=2)
-        except Exception:
-            pass  # Fail silently for metadata updates
+        stat = os.stat(key)
+        self._metadata_cache[key] = ((stat.st_mtime_ns, stat.st_size), metadata)
 
-    def _create_backup_directory(self, feature_name: str) -> Optional[Path]:
+    def _create_backup_directory(
+        self, feature_name: str, refresh: bool = False
+    ) -> Optional[Path]:
         """
         Create backup directory for a specification.
 
+        Directories this manager has already created are returned without
+        another mkdir; refresh=True recreates one that may have been removed.
+
         Args:
             feature_name: Feature name
+            refresh: Create the directory even if it is known to exist
 
         Returns:
             Path to backup directory or None if creation failed
         """
+        key = os.path.join(self.base_path, ".backups", feature_name)
+        backup_base = self._backup_dirs.get(key)
+        if backup_base is not None and not refresh:
+            return backup_base
+
         try:
-            backup_base = self.base_path / ".backups" / feature_name
+            backup_base = Path(key)
             backup_base.mkdir(parents=True, exist_ok=True)
-            return backup_base
         except Exception:
+            self._backup_dirs.pop(key, None)
             return None
+        self._backup_dirs[key] = backup_base
+        return backup_base
 
     def create_version_snapshot(self, feature_name: str, version_name: str) -> bool:
         """
@@ -553,10 +842,9 @@ class SpecManager(BaseManager):
             True if snapshot created successfully
         """
         try:
-            kebab_name = self._to_kebab_case(feature_name)
-            spec_dir = self.base_path / kebab_name
+            spec_dir = self._spec_path(feature_name)
 
-            if not spec_dir.exists():
+            if not os.path.isdir(spec_dir):
                 return False
 
             # Create versions directory
@@ -564,20 +852,21 @@ class SpecManager(BaseManager):
             versions_dir.mkdir(exist_ok=True)
 
             # Create version snapshot directory
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = _file_timestamp()
             version_dir = versions_dir / f"{version_name}_{timestamp}"
             version_dir.mkdir(exist_ok=True)
 
-            # Copy all documents to version directory
-            for doc_type in ["requirements", "design", "tasks"]:
-                source_file = spec_dir / f"{doc_type}.md"
-                if source_file.exists():
-                    shutil.copy2(source_file, version_dir / f"{doc_type}.md")
-
-            # Copy metadata
-            metadata_file = spec_dir / "metadata.json"
-            if metadata_file.exists():
-                shutil.copy2(metadata_file, version_dir / "metadata.json")
+            # Copy all documents and metadata to version directory; a
+            # missing source is found by the copy's own open
+            for filename in _SNAPSHOT_FILES:
+                try:
+                    _snapshot_file(
+                        os.path.join(spec_dir, filename),
+                        os.path.join(version_dir, filename),
+                        keep_stats=False,
+                    )
+                except FileNotFoundError:
+                    continue
 
             # Create version info
             version_info = {
@@ -587,8 +876,9 @@ class SpecManager(BaseManager):
                 "description": f"Version snapshot: {version_name}",
             }
 
-            with open(version_dir / "version_info.json", "w") as f:
-                json.dump(version_info, f, indent=2)
+            _write_file(
+                version_dir / "version_info.json", _JSON_ENCODER.encode(version_info)
+            )
 
             return True
 
@@ -607,25 +897,23 @@ class SpecManager(BaseManager):
             List of version information dictionaries
         """
         try:
-            kebab_name = self._to_kebab_case(feature_name)
-            spec_dir = self.base_path / kebab_name
+            spec_dir = self._spec_path(feature_name)
             versions_dir = spec_dir / ".versions"
 
-            if not versions_dir.exists():
+            if not os.path.isdir(versions_dir):
                 return []
 
-            versions = []
-            for version_dir in versions_dir.iterdir():
-                if version_dir.is_dir():
-                    version_info_file = version_dir / "version_info.json"
-                    if version_info_file.exists():
-                        try:
-                            with open(version_info_file, "r") as f:
-                                version_info = json.load(f)
-                            version_info["directory"] = str(version_dir)
-                            versions.append(version_info)
-                        except json.JSONDecodeError:
-                            continue
+            with os.scandir(versions_dir) as entries:
+                version_dirs = [entry.path for entry in entries if entry.is_dir()]
+
+            # Larger archives read their info files on a small pool so the
+            # file reads overlap; the executor is not worth starting for a few
+            if len(version_dirs) >= _PREFETCH_MIN_VERSIONS:
+                with ThreadPoolExecutor(max_workers=_PREFETCH_WORKERS) as pool:
+                    loaded = list(pool.map(_read_version_info, version_dirs))
+            else:
+                loaded = [_read_version_info(path) for path in version_dirs]
+            versions = [info for info in loaded if info is not None]
 
             # Sort by creation date (newest first)
             versions.sort(key=lambda x: str(x.get("created_at", "")), reverse=True)
@@ -646,8 +934,7 @@ class SpecManager(BaseManager):
             True if rollback successful
         """
         try:
-            kebab_name = self._to_kebab_case(feature_name)
-            spec_dir = self.base_path / kebab_name
+            spec_dir = self._spec_path(feature_name)
 
             # Find the version directory
             versions = self.list_versions(feature_name)
@@ -661,18 +948,18 @@ class SpecManager(BaseManager):
                 return False
 
             version_dir = Path(target_version["directory"])
-            if not version_dir.exists():
+            if not os.path.isdir(version_dir):
                 return False
 
             # Create backup of current state before rollback
             self.create_version_snapshot(
-                feature_name, f"pre_rollback_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+                feature_name, f"pre_rollback_{_file_timestamp()}"
             )
 
             # Restore documents from version
             for doc_type in ["requirements", "design", "tasks"]:
                 version_file = version_dir / f"{doc_type}.md"
-                target_file = spec_dir / f"{doc_type}.md"
+                target_file = self._spec_path(feature_name, f"{doc_type}.md")
 
                 if version_file.exists():
                     shutil.copy2(version_file, target_file)
@@ -680,8 +967,7 @@ class SpecManager(BaseManager):
             # Restore metadata (but update rollback info)
             version_metadata_file = version_dir / "metadata.json"
             if version_metadata_file.exists():
-                with open(version_metadata_file, "r") as f:
-                    metadata = json.load(f)
+                metadata = dict(self._load_metadata(version_metadata_file))
 
                 # Update rollback information
                 metadata["last_rollback"] = {
@@ -689,10 +975,10 @@ class SpecManager(BaseManager):
                     "from_version": version_name,
                     "rollback_reason": "Manual rollback",
                 }
-                metadata["last_modified"] = datetime.now().isoformat()
-
-                with open(spec_dir / "metadata.json", "w") as f:
-                    json.dump(metadata, f, indent=2)
+                self._store_metadata(
+                    self._spec_path(feature_name, "metadata.json"), metadata
+                )
+                self._update_metadata_timestamp(spec_dir)
 
             return True
 
@@ -717,40 +1003,45 @@ class SpecManager(BaseManager):
             kebab_name = self._to_kebab_case(feature_name)
             backup_dir = self._create_backup_directory(kebab_name)
 
-            if not backup_dir or not backup_dir.exists():
+            if not backup_dir:
                 return []
 
             backups = []
-            pattern = f"{document_type}_*.backup"
+            prefix_length = len(document_type) + 1
 
-            for backup_file in backup_dir.glob(pattern):
+            for entry in self._backup_entries(backup_dir, document_type):
                 # Extract timestamp from filename
-                filename = backup_file.name
-                timestamp_part = filename.replace(f"{document_type}_", "").replace(
-                    ".backup", ""
-                )
+                filename = entry.name
+                timestamp_part = filename[prefix_length : -len(".backup")]
 
+                match = _BACKUP_TIMESTAMP_RE.fullmatch(timestamp_part)
+                if not match:
+                    continue
+
+                year, month, day, hour, minute, second, micros = match.groups()
                 try:
-                    # Parse timestamp (try with microseconds first, then without)
-                    try:
-                        backup_time = datetime.strptime(
-                            timestamp_part, "%Y%m%d_%H%M%S_%f"
-                        )
-                    except ValueError:
-                        backup_time = datetime.strptime(timestamp_part, "%Y%m%d_%H%M%S")
-
-                    backups.append(
-                        {
-                            "filename": filename,
-                            "path": str(backup_file),
-                            "timestamp": backup_time.isoformat(),
-                            "size": backup_file.stat().st_size,
-                            "document_type": document_type,
-                        }
+                    backup_time = datetime(
+                        int(year),
+                        int(month),
+                        int(day),
+                        int(hour),
+                        int(minute),
+                        int(second),
+                        int(micros.ljust(6, "0")) if micros else 0,
                     )
                 except ValueError:
                     continue
 
+                backups.append(
+                    {
+                        "filename": filename,
+                        "path": entry.path,
+                        "timestamp": backup_time.isoformat(),
+                        "size": entry.stat().st_size,
+                        "document_type": document_type,
+                    }
+                )
+
             # Sort by timestamp (newest first)
             backups.sort(key=lambda x: str(x["timestamp"]), reverse=True)
             return backups
@@ -774,7 +1065,7 @@ class SpecManager(BaseManager):
         """
         try:
             kebab_name = self._to_kebab_case(feature_name)
-            spec_dir = self.base_path / kebab_name
+            spec_dir = self._spec_path(feature_name)
             backup_dir = self._create_backup_directory(kebab_name)
 
             if not backup_dir:
@@ -784,15 +1075,18 @@ class SpecManager(BaseManager):
             if not backup_file.exists():
                 return False
 
+            target_file = self.get_document_path(feature_name, document_type)
+
+            # Restoring the content the document already has is a no-op
+            if _same_content(backup_file, target_file):
+                return True
+
             # Create backup of current state before restore
             self.backup_document(feature_name, document_type)
 
             # Restore from backup
-            if document_type == "metadata":
-                target_file = spec_dir / "metadata.json"
-            else:
-                target_file = spec_dir / f"{document_type}.md"
-
+            # copy2 carries the backup's mtime over, so drop any cached parse
+            self._metadata_cache.pop(str(target_file), None)
             shutil.copy2(backup_file, target_file)
 
             # Update metadata
@@ -805,30 +1099,77 @@ class SpecManager(BaseManager):
             return False
 
     def _cleanup_old_backups(
-        self, backup_dir: Path, document_type: str, max_backups: int = 10
+        self,
+        backup_dir: Path,
+        document_type: str,
+        max_backups: int = 10,
+        new_backup: Optional[Path] = None,
     ) -> None:
         """
         Clean up old backup files, keeping only the most recent ones.
 
+        The retained backups are listed once per directory and document
+        type and then tracked oldest first, so recording a new backup
+        removes the oldest ones without listing the directory again.
+
         Args:
             backup_dir: Backup directory path
             document_type: Type of document
             max_backups: Maximum number of backups to keep
+            new_backup: Backup just written, if any
         """
+        key = (os.fspath(backup_dir), document_type)
+        retained = self._retained_backups.get(key)
         try:
-            pattern = f"{document_type}_*.backup"
-            backup_files = list(backup_dir.glob(pattern))
+            if retained is None or new_backup is None:
+                backup_files = self._backup_entries(backup_dir, document_type)
 
-            if len(backup_files) <= max_backups:
-                return
-
-            # Sort by modification time (oldest first)
-            backup_files.sort(key=lambda f: f.stat().st_mtime)
+                # Sort by modification time (oldest first)
+                backup_files.sort(key=lambda entry: entry.stat().st_mtime_ns)
+                retained = deque(entry.path for entry in backup_files)
+                self._retained_backups[key] = retained
+            else:
+                retained.append(os.fspath(new_backup))
 
             # Remove oldest files
-            files_to_remove = backup_files[:-max_backups]
-            for file_to_remove in files_to_remove:
-                file_to_remove.unlink()
+            while len(retained) > max_backups:
+                try:
+                    os.unlink(retained.popleft())
+                except FileNotFoundError:
+                    # Backups were removed behind the manager; list them again
+                    del self._retained_backups[key]
+                    self._cleanup_old_backups(backup_dir, document_type, max_backups)
+                    return
 
         except Exception:
-            pass  # Fail silently for cleanup operations
+            # Fail silently for cleanup operations; list again next time
+            self._retained_backups.pop(key, None)
+
+    def _backup_entries(
+        self, backup_dir: Path, document_type: str
+    ) -> List[os.DirEntry]:
+        """
+        List the backup files of one document type.
+
+        Matches the same names as the glob "<document_type>_*.backup" with
+        plain prefix and suffix tests over a single scandir.
+
+        Args:
+            backup_dir: Backup directory path
+            document_type: Type of document
+
+        Returns:
+            Directory entries of the matching backup files
+        """
+        prefix = f"{document_type}_"
+        suffix = ".backup"
+        min_length = len(prefix) + len(suffix)
+
+        with os.scandir(backup_dir) as entries:
+            return [
+                entry
+                for entry in entries
+                if entry.name.startswith(prefix)
+                and entry.name.endswith(suffix)
+                and len(entry.name) >= min_length
+            ]
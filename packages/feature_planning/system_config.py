@@ -6,15 +6,19 @@ procedures for the Feature Planning System.
 """
 
 import json
+import logging
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-from dataclasses import dataclass, asdict
+from typing import AbstractSet, Any, Dict, List, Optional, Set, Tuple
+from dataclasses import dataclass, asdict, fields, replace
 
 from .base import ConfigurationError
 
+logger = logging.getLogger("feature_planning.system")
 
-@dataclass
+
+@dataclass(slots=True)
 class SystemConfiguration:
     """System configuration settings"""
     
@@ -52,75 +56,8 @@ class SystemConfiguration:
     log_file: Optional[str] = None
 
 
-class SystemInitializer:
-    """Handles system initialization and setup procedures"""
-    
-    def __init__(self, config: Optional[SystemConfiguration] = None):
-        self.config = config or SystemConfiguration()
-        self.config_file = Path(".kiro/settings/feature_planning.json")
-    
-    def initialize_system(self) -> bool:
-        """Initialize the complete feature planning system"""
-        try:
-            # Create necessary directories
-            self._create_directories()
-            
-            # Initialize configuration
-            self._initialize_configuration()
-            
-            # Create default templates
-            self._create_default_templates()
-            
-            # Validate system setup
-            self._validate_system_setup()
-            
-            return True
-        except Exception as e:
-            print(f"System initialization failed: {e}")
-            return False
-    
-    def _create_directories(self) -> None:
-        """Create necessary directory structure"""
-        directories = [
-            self.config.specs_directory,
-            self.config.templates_directory,
-            self.config.backup_directory,
-            ".kiro/settings",
-            ".kiro/logs"
-        ]
-        
-        for directory in directories:
-            Path(directory).mkdir(parents=True, exist_ok=True)
-    
-    def _initialize_configuration(self) -> None:
-        """Initialize system configuration file"""
-        # Create config file if it doesn't exist
-        if not self.config_file.exists():
-            self.save_configuration(self.config)
-        else:
-            # Load existing configuration and merge with defaults
-            existing_config = self.load_configuration()
-            if existing_config:
-                # Update with any new default settings
-                config_dict = asdict(self.config)
-                existing_dict = asdict(existing_config)
-                
-                # Add any new settings that don't exist
-                for key, value in config_dict.items():
-                    if key not in existing_dict:
-                        existing_dict[key] = value
-                
-                # Save updated configuration
-                updated_config = SystemConfiguration(**existing_dict)
-                self.save_configuration(updated_config)
-                self.config = updated_config
-    
-    def _create_default_templates(self) -> None:
-        """Create default document templates"""
-        templates_dir = Path(self.config.templates_directory)
-        
-        # Requirements template
-        requirements_template = """# Requirements Document
+# Default document templates written on initialization
+_REQUIREMENTS_TEMPLATE = """# Requirements Document
 
 ## Introduction
 
@@ -154,8 +91,7 @@ This specification defines [brief description of the feature/system].
 1. [Additional EARS-compliant requirements...]
 """
 
-        # Design template
-        design_template = """# Design Document
+_DESIGN_TEMPLATE = """# Design Document
 
 ## Overview
 
@@ -214,8 +150,7 @@ class EntityModel:
 - [Validation testing approach]
 """
 
-        # Tasks template
-        tasks_template = """# Implementation Plan
+_TASKS_TEMPLATE = """# Implementation Plan
 
 - [ ] 1. Set up core infrastructure
   - Create base classes and interfaces
@@ -251,46 +186,172 @@ class EntityModel:
   - _Requirements: All requirements_
 """
 
-        # Write template files
-        templates = {
-            "requirements_template.md": requirements_template,
-            "design_template.md": design_template,
-            "tasks_template.md": tasks_template
+# Encoded once at import; files are written as bytes
+_DEFAULT_TEMPLATES = (
+    ("requirements_template.md", _REQUIREMENTS_TEMPLATE.encode("utf-8")),
+    ("design_template.md", _DESIGN_TEMPLATE.encode("utf-8")),
+    ("tasks_template.md", _TASKS_TEMPLATE.encode("utf-8")),
+)
+
+# Templates every initialized system provides
+_REQUIRED_TEMPLATES = (
+    "requirements_template.md",
+    "design_template.md",
+    "tasks_template.md",
+)
+
+# Shared encoder for the configuration file; json.dumps(..., indent=2)
+# would build a new encoder on every call
+_JSON_ENCODER = json.JSONEncoder(indent=2)
+
+# Settings a complete configuration file holds
+_FIELD_NAMES = frozenset(f.name for f in fields(SystemConfiguration))
+
+# Parsed configuration files keyed by absolute path, tagged with the
+# (st_mtime_ns, st_size) they were parsed at and whether the file set
+# every field
+_config_cache: Dict[str, Tuple[Tuple[int, int], SystemConfiguration, bool]] = {}
+
+
+class SystemInitializer:
+    """Handles system initialization and setup procedures"""
+    
+    def __init__(self, config: Optional[SystemConfiguration] = None):
+        self.config = config or SystemConfiguration()
+        self.config_file = Path(".kiro/settings/feature_planning.json")
+        # Absolute paths of default templates this initializer has written
+        # or found
+        self._templates_written: Set[str] = set()
+    
+    @property
+    def config(self) -> SystemConfiguration:
+        """Current configuration"""
+        return self._config
+    
+    @config.setter
+    def config(self, config: SystemConfiguration) -> None:
+        # Paths derived from the configuration are built once per assignment
+        self._config = config
+        self._templates_dir = Path(config.templates_directory)
+        self._required_dirs = (
+            config.specs_directory,
+            config.templates_directory,
+            ".kiro/settings",
+        )
+        # Parents sort ahead of their children, so each directory is
+        # normally one mkdir; only a missing ancestor needs the recursive walk
+        setup_dirs = {
+            os.path.normpath(directory)
+            for directory in (
+                *self._required_dirs,
+                config.backup_directory,
+                ".kiro/logs",
+            )
         }
+        self._setup_dirs = tuple(sorted(setup_dirs, key=lambda d: d.count(os.sep)))
+    
+    def initialize_system(self) -> bool:
+        """Initialize the complete feature planning system"""
+        try:
+            # Create necessary directories
+            verified = self._create_directories()
+            
+            # Initialize configuration
+            self._initialize_configuration()
+            
+            # Create default templates
+            verified |= self._create_default_templates()
+            
+            # Validate system setup; paths the steps above confirmed are
+            # not probed again
+            self._validate_system_setup(verified)
+            
+            return True
+        except Exception as e:
+            print(f"System initialization failed: {e}")
+            return False
+    
+    def _create_directories(self) -> Set[str]:
+        """Create necessary directory structure, returning the directories"""
+        for directory in self._setup_dirs:
+            try:
+                os.mkdir(directory)
+            except FileExistsError:
+                # Something other than a directory may sit at the path
+                if not os.path.isdir(directory):
+                    raise
+            except FileNotFoundError:
+                Path(directory).mkdir(parents=True, exist_ok=True)
         
-        for filename, content in templates.items():
-            template_file = templates_dir / filename
-            if not template_file.exists():
-                with open(template_file, 'w', encoding='utf-8') as f:
+        return set(self._setup_dirs)
+    
+    def _initialize_configuration(self) -> None:
+        """Initialize system configuration file"""
+        # Create config file if it doesn't exist
+        if not self.config_file.exists():
+            self.save_configuration(self.config)
+        else:
+            # Load existing configuration; settings missing from the file
+            # were filled with their defaults
+            existing_config, complete = self._read_configuration()
+            if existing_config:
+                # Only rewrite the file when it lacks newer settings
+                if not complete:
+                    self.save_configuration(existing_config)
+                self.config = existing_config
+    
+    def _create_default_templates(self) -> Set[str]:
+        """Create default document templates, returning those written or found"""
+        confirmed = set()
+        for filename, content in _DEFAULT_TEMPLATES:
+            template_file = self._templates_dir / filename
+            key = os.path.abspath(template_file)
+            if key in self._templates_written:
+                continue
+            # Mode "x" makes the open itself the existence check
+            try:
+                with open(template_file, 'xb') as f:
                     f.write(content)
+            except FileExistsError:
+                # An existing template is kept; anything else at the path
+                # is an error
+                if not template_file.is_file():
+                    raise
+            self._templates_written.add(key)
+            confirmed.add(os.fspath(template_file))
+        
+        return confirmed
     
-    def _validate_system_setup(self) -> None:
+    def _validate_system_setup(self, verified: AbstractSet[str] = frozenset()) -> None:
         """Validate that system is properly set up"""
-        # Check directories exist
-        required_dirs = [
-            self.config.specs_directory,
-            self.config.templates_directory,
-            ".kiro/settings"
-        ]
-        
-        for directory in required_dirs:
-            if not Path(directory).exists():
+        # Check directories exist; those in verified (normalized) were just
+        # confirmed by the setup steps and are not probed again
+        for directory in self._required_dirs:
+            if os.path.normpath(directory) in verified:
+                continue
+            if not os.path.exists(directory):
                 raise ConfigurationError(f"Required directory not found: {directory}")
         
         # Check configuration file exists
         if not self.config_file.exists():
             raise ConfigurationError("Configuration file not found")
         
-        # Check templates exist
-        templates_dir = Path(self.config.templates_directory)
-        required_templates = [
-            "requirements_template.md",
-            "design_template.md", 
-            "tasks_template.md"
+        # Check templates exist; one removed since it was written is
+        # forgotten and written again
+        missing = [
+            t
+            for t in _REQUIRED_TEMPLATES
+            if os.fspath(self._templates_dir / t) not in verified
+            and not (self._templates_dir / t).exists()
         ]
+        if missing:
+            for template in missing:
+                key = os.path.abspath(self._templates_dir / template)
+                self._templates_written.discard(key)
+            self._create_default_templates()
         
-        for template in required_templates:
-            if not (templates_dir / template).exists():
+        for template in missing:
+            if not (self._templates_dir / template).exists():
                 raise ConfigurationError(f"Required template not found: {template}")
     
     def save_configuration(self, config: SystemConfiguration) -> bool:
@@ -298,8 +359,23 @@ class EntityModel:
         try:
             self.config_file.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(asdict(config), f, indent=2)
+            key = os.path.abspath(self.config_file)
+            _config_cache.pop(key, None)
+            # Serialize first so the file gets one write instead of one
+            # per JSON token
+            data = _JSON_ENCODER.encode(asdict(config)).encode('utf-8')
+            with open(self.config_file, 'wb') as f:
+                f.write(data)
+            
+            # The written file parses back to this configuration
+            try:
+                stat = os.stat(key)
+            except OSError:
+                pass
+            else:
+                _config_cache[key] = (
+                    (stat.st_mtime_ns, stat.st_size), replace(config), True
+                )
             
             return True
         except Exception as e:
@@ -308,17 +384,47 @@ class EntityModel:
     
     def load_configuration(self) -> Optional[SystemConfiguration]:
         """Load configuration from file"""
+        return self._read_configuration()[0]
+    
+    def _read_configuration(self) -> Tuple[Optional[SystemConfiguration], bool]:
+        """Load configuration from file and whether it sets every field"""
         try:
-            if not self.config_file.exists():
-                return None
+            key = os.path.abspath(self.config_file)
+            try:
+                stat = os.stat(key)
+            except FileNotFoundError:
+                return None, False
+            signature = (stat.st_mtime_ns, stat.st_size)
+            
+            # Reuse the parse while the file is unchanged; callers get a copy
+            cached = _config_cache.get(key)
+            if cached is not None and cached[0] == signature:
+                return replace(cached[1]), cached[2]
             
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
+            # json.loads takes the UTF-8 bytes directly, skipping the
+            # text-mode decoding layer
+            with open(self.config_file, 'rb', buffering=0) as f:
+                config_data = json.loads(f.readall())
             
-            return SystemConfiguration(**config_data)
+            unknown = config_data.keys() - _FIELD_NAMES
+            if unknown:
+                # Settings no longer in the schema are ignored instead of
+                # failing the whole load
+                logger.debug(
+                    "Ignoring unknown configuration settings: %s",
+                    ", ".join(sorted(unknown)),
+                )
+                config_data = {
+                    k: v for k, v in config_data.items() if k in _FIELD_NAMES
+                }
+            
+            config = SystemConfiguration(**config_data)
+            complete = _FIELD_NAMES <= config_data.keys()
+            _config_cache[key] = (signature, config, complete)
+            return replace(config), complete
         except Exception as e:
             print(f"Failed to load configuration: {e}")
-            return None
+            return None, False
     
     def reset_configuration(self) -> bool:
         """Reset configuration to defaults"""
@@ -354,34 +460,23 @@ class EntityModel:
                 status["errors"].append("Configuration file invalid or corrupted")
             
             # Check directories
-            required_dirs = [
-                self.config.specs_directory,
-                self.config.templates_directory,
-                ".kiro/settings"
-            ]
-            
-            missing_dirs = []
-            for directory in required_dirs:
-                if not Path(directory).exists():
-                    missing_dirs.append(directory)
+            missing_dirs = [d for d in self._required_dirs if not os.path.exists(d)]
             
             if not missing_dirs:
                 status["directories_exist"] = True
             else:
                 status["errors"].append(f"Missing directories: {', '.join(missing_dirs)}")
             
-            # Check templates
-            templates_dir = Path(self.config.templates_directory)
-            required_templates = [
-                "requirements_template.md",
-                "design_template.md",
-                "tasks_template.md"
-            ]
+            # Check templates against one listing of the templates directory
+            try:
+                with os.scandir(self.config.templates_directory) as entries:
+                    present_templates = {entry.name for entry in entries}
+            except (FileNotFoundError, NotADirectoryError):
+                present_templates = set()
             
-            missing_templates = []
-            for template in required_templates:
-                if not (templates_dir / template).exists():
-                    missing_templates.append(template)
+            missing_templates = [
+                t for t in _REQUIRED_TEMPLATES if t not in present_templates
+            ]
             
             if not missing_templates:
                 status["templates_exist"] = True
@@ -409,6 +504,10 @@ class FeaturePlanningSystem:
         self.initializer = SystemInitializer(config)
         self.config = self.initializer.config
         self._initialized = False
+        # (configuration, asdict of it) last reported by get_system_info
+        self._config_snapshot: Optional[
+            Tuple[SystemConfiguration, Dict[str, Any]]
+        ] = None
     
     def initialize(self) -> bool:
         """Initialize the complete system"""
@@ -428,12 +527,15 @@ class FeaturePlanningSystem:
     def update_configuration(self, **kwargs) -> bool:
         """Update system configuration"""
         try:
-            config_dict = asdict(self.config)
-            config_dict.update(kwargs)
-            
-            new_config = SystemConfiguration(**config_dict)
+            new_config = replace(self.config, **kwargs)
+        except TypeError as e:
+            print(f"Invalid configuration setting: {e}")
+            return False
+        
+        try:
             if self.initializer.save_configuration(new_config):
                 self.config = new_config
+                self.initializer.config = new_config
                 return True
             return False
         except Exception:
@@ -443,10 +545,17 @@ class FeaturePlanningSystem:
         """Get comprehensive system information"""
         status = self.initializer.get_system_status()
         
+        # Configurations are replaced rather than mutated, so the snapshot
+        # stays valid while the same object is current
+        snapshot = self._config_snapshot
+        if snapshot is None or snapshot[0] is not self.config:
+            snapshot = (self.config, asdict(self.config))
+            self._config_snapshot = snapshot
+        
         return {
             "version": "1.0.0",
             "initialized": self._initialized,
-            "configuration": asdict(self.config),
+            "configuration": dict(snapshot[1]),
             "status": status,
             "directories": {
                 "specs": self.config.specs_directory,
@@ -456,16 +565,10 @@ class FeaturePlanningSystem:
         }
 
 
-# Global system instance
-_system_instance = None
-
-
+@lru_cache(maxsize=None)
 def get_system() -> FeaturePlanningSystem:
-    """Get the global system instance"""
-    global _system_instance
-    if _system_instance is None:
-        _system_instance = FeaturePlanningSystem()
-    return _system_instance
+    """Get the global system instance (get_system.cache_clear() resets it)"""
+    return FeaturePlanningSystem()
 
 
 def initialize_system(config: Optional[SystemConfiguration] = None) -> bool:
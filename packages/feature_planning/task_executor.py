@@ -5,15 +5,110 @@ This module provides the framework for executing individual tasks from
 implementation plans with proper context loading and validation.
 """
 
+import atexit
+import copy
+import io
 import json
+import os
 import re
+from collections.abc import Mapping
+from contextlib import suppress
+from dataclasses import replace
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 from .base import BaseManager, Task, TaskStatus, ValidationResult, WorkflowError
 from .config import get_config
 from .spec_manager import SpecManager
 
+# Document structure patterns used by the parsers
+_SECTION_RE = re.compile(r"\n## ")
+_DESIGN_SECTIONS = (
+    ("overview", "overview"),
+    ("architecture", "architecture"),
+    ("components", "components"),
+    ("data models", "data_models"),
+    ("error handling", "error_handling"),
+    ("testing", "testing_strategy"),
+)
+_REQUIREMENT_HEADER_RE = re.compile(r"\n### Requirement \d+")
+_USER_STORY_RE = re.compile(r"\*\*User Story:\*\* (.+)")
+_ACCEPTANCE_HEADER = "#### Acceptance Criteria\n\n"
+_TASK_LINE_RE = re.compile(r"^- \[[ x]\] (\d+(?:\.\d+)?)\.?\s+(.+)")
+_REQ_REF_RE = re.compile(r"_Requirements: ([^_]+)_")
+_LIST_PREFIX_RE = re.compile(r"^\s*\d+\.\s*")
+
+# Execution state is machine-read; compact output keeps json on its C encoder
+_STATE_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+# Deliverables by task title keyword, checked in order
+_DELIVERABLES_BY_KEYWORD = (
+    ("implement", ("Implementation code", "Unit tests (if required)")),
+    ("create", ("New component/module", "Documentation")),
+    ("build", ("Built component", "Integration tests")),
+)
+_DEFAULT_DELIVERABLES = ("Task completion", "Code changes")
+
+
+@lru_cache(maxsize=256)
+def _execution_state_path(feature_name: str) -> Path:
+    """Get the execution state file path for a feature."""
+    return Path(f".kiro/specs/{feature_name}/execution_state.json")
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Return a read-only copy of parsed data: dicts become mapping proxies
+    and lists tuples, so the parse can be shared between loads.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Return a mutable deep copy of data frozen by _freeze."""
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_thaw(item) for item in value]
+    return value
+
+
+def _design_section_key(header: str) -> Optional[str]:
+    """Map a design section header to its key in the parsed design."""
+    header = header[:32].lower()
+    for prefix, key in _DESIGN_SECTIONS:
+        if header.startswith(prefix):
+            return key
+    return None
+
+
+def _acceptance_criteria_text(section: str) -> Optional[str]:
+    """
+    Get the acceptance criteria block of a requirement section.
+
+    The block runs from the criteria header up to the next "##" heading or
+    the end of the section, found with plain substring scans.
+
+    Returns:
+        Non-empty criteria text, or None if the section has no criteria
+    """
+    start = section.find(_ACCEPTANCE_HEADER)
+    if start == -1:
+        return None
+    start += len(_ACCEPTANCE_HEADER)
+    if start == len(section):
+        return None
+
+    end = section.find("\n##", start + 1)
+    return section[start:] if end == -1 else section[start:end]
+
 
 class TaskExecutor(BaseManager):
     """
@@ -30,9 +125,18 @@ class TaskExecutor(BaseManager):
         self.spec_manager = SpecManager()
         self.context_cache: Dict[str, Any] = {}
         self.current_task: Optional[Dict[str, Any]] = None
-        self.execution_state_file = Path(
-            f".kiro/specs/{feature_name}/execution_state.json"
-        )
+        self._parsed_signature: Optional[Tuple[Any, ...]] = None
+        self._parsed_spec: Dict[str, Any] = {}
+        self._parsed_documents: Dict[str, Tuple[str, Any]] = {}
+        self._indexed_tasks: Optional[List[Any]] = None
+        self._task_index: Dict[str, Dict[str, Any]] = {}
+        self._saved_state: Optional[Tuple[str, str, Tuple[int, int]]] = None
+        self._pending_state: Optional[Tuple[Path, Dict[str, Any]]] = None
+        self._indexed_requirements: Optional[List[Any]] = None
+        self._requirement_positions: Dict[Any, List[int]] = {}
+        self._task_req_cache: Dict[Any, Tuple[Dict[str, Any], List[Any]]] = {}
+        self._last_validation: Optional[Tuple[Tuple[Any, ...], ValidationResult]] = None
+        self.execution_state_file = _execution_state_path(feature_name)
 
     def create(self, name: str, **kwargs: Any) -> bool:
         """
@@ -47,7 +151,7 @@ class TaskExecutor(BaseManager):
         """
         try:
             self.feature_name = name
-            self.execution_state_file = Path(f".kiro/specs/{name}/execution_state.json")
+            self.execution_state_file = _execution_state_path(name)
 
             # Initialize execution state
             execution_state: Dict[str, Any] = {
@@ -59,6 +163,7 @@ class TaskExecutor(BaseManager):
                 "created_at": self._get_timestamp(),
             }
 
+            self._replace_pending_state()
             self._save_execution_state(execution_state)
             return True
         except Exception as e:
@@ -77,13 +182,19 @@ class TaskExecutor(BaseManager):
         """
         try:
             self.feature_name = name
-            self.execution_state_file = Path(f".kiro/specs/{name}/execution_state.json")
-
-            if self.execution_state_file.exists():
-                with open(self.execution_state_file, "r") as f:
-                    data = json.load(f)
-                    return data if isinstance(data, dict) else None
-            return None
+            self.execution_state_file = _execution_state_path(name)
+
+            # Deferred updates for this file are newer than its contents
+            pending = self._pending_state
+            if pending is not None:
+                if pending[0] == self.execution_state_file:
+                    return copy.deepcopy(pending[1])
+                self.flush_state()
+
+            # Read the whole file in one call and let json decode the bytes
+            with open(self.execution_state_file, "rb", buffering=0) as f:
+                data = json.loads(f.readall())
+            return data if isinstance(data, dict) else None
         except Exception:
             return None
 
@@ -100,6 +211,7 @@ class TaskExecutor(BaseManager):
         """
         try:
             if isinstance(content, dict):
+                self._replace_pending_state()
                 self._save_execution_state(content)
                 return True
             return False
@@ -117,7 +229,13 @@ class TaskExecutor(BaseManager):
             True if deletion successful
         """
         try:
-            execution_file = Path(f".kiro/specs/{name}/execution_state.json")
+            execution_file = _execution_state_path(name)
+            if (
+                self._pending_state is not None
+                and self._pending_state[0] == execution_file
+            ):
+                self._pending_state = None
+                _dirty_executors.discard(self)
             if execution_file.exists():
                 execution_file.unlink()
             return True
@@ -129,57 +247,28 @@ class TaskExecutor(BaseManager):
         Load complete execution context including all spec documents.
 
         Returns:
-            Dictionary containing requirements, design, tasks, and metadata
+            Dictionary containing requirements, design, tasks, and metadata;
+            the parsed documents are read-only (mapping proxies and tuples)
         """
         try:
-            # Load specification documents
-            spec_data = self.spec_manager.load(self.feature_name)
-            if not spec_data:
-                raise WorkflowError(
-                    f"Specification not found for feature: {self.feature_name}"
-                )
-
-            # Extract documents
-            documents = spec_data.get("documents", {})
-            metadata = spec_data.get("metadata", {})
-
-            # Validate required documents exist
-            required_docs = ["requirements", "design", "tasks"]
-            missing_docs = [doc for doc in required_docs if not documents.get(doc)]
-
-            if missing_docs:
-                raise WorkflowError(
-                    f"Missing required documents: {', '.join(missing_docs)}"
-                )
-
-            # Parse task list from tasks document
-            tasks = (
-                self._parse_task_list(documents["tasks"])
-                if documents.get("tasks")
-                else []
-            )
-
-            # Build execution context
+            # Reuse the parsed documents while the spec files are unchanged
+            signature = self._spec_signature()
+            if signature is None or signature != self._parsed_signature:
+                self._parsed_spec = self._parse_spec()
+                self._parsed_signature = signature
+            parsed = self._parsed_spec
+
+            # Build execution context; the parsed documents are read-only,
+            # so every load shares them
             context = {
                 "feature_name": self.feature_name,
-                "requirements": (
-                    self._parse_requirements(documents["requirements"])
-                    if documents.get("requirements")
-                    else []
-                ),
-                "design": (
-                    self._parse_design(documents["design"])
-                    if documents.get("design")
-                    else {}
-                ),
-                "tasks": tasks,
-                "metadata": metadata,
-                "spec_directory": str(spec_data.get("directory", "")),
+                **parsed,
                 "context_loaded_at": self._get_timestamp(),
             }
 
             # Cache context for performance
             self.context_cache = context
+            self._index_tasks()
 
             # Update execution state
             execution_state = self.load(self.feature_name) or {}
@@ -192,10 +281,117 @@ class TaskExecutor(BaseManager):
         except Exception as e:
             raise WorkflowError(f"Failed to load execution context: {e}")
 
+    def flush_state(self) -> bool:
+        """
+        Write deferred execution state updates to disk.
+
+        Returns:
+            True if there were pending updates to write
+        """
+        pending = self._pending_state
+        if pending is None:
+            return False
+
+        self._pending_state = None
+        _dirty_executors.discard(self)
+        self._save_execution_state(pending[1], pending[0])
+        return True
+
+    def _replace_pending_state(self) -> None:
+        """Drop deferred updates that a full state write is about to replace."""
+        pending = self._pending_state
+        if pending is not None and pending[0] != self.execution_state_file:
+            self.flush_state()
+        self._pending_state = None
+        _dirty_executors.discard(self)
+
+    def _spec_signature(self) -> Optional[Tuple[Any, ...]]:
+        """
+        Get the paths, mtimes and sizes of the specification files.
+
+        Returns:
+            Signature tuple, or None if a required document is missing
+        """
+        signature = []
+        for doc_type in ("requirements", "design", "tasks", "metadata"):
+            path = self.spec_manager.get_document_path(self.feature_name, doc_type)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                if doc_type != "metadata":
+                    return None
+                signature.append((str(path), None))
+            else:
+                signature.append((str(path), stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
+
+    def _parse_spec(self) -> Dict[str, Any]:
+        """Load and parse the specification documents for the feature."""
+        # Load specification documents
+        spec_data = self.spec_manager.load(self.feature_name)
+        if not spec_data:
+            raise WorkflowError(
+                f"Specification not found for feature: {self.feature_name}"
+            )
+
+        # Extract documents
+        documents = spec_data.get("documents", {})
+        metadata = spec_data.get("metadata", {})
+
+        # Validate required documents exist
+        required_docs = ["requirements", "design", "tasks"]
+        missing_docs = [doc for doc in required_docs if not documents.get(doc)]
+
+        if missing_docs:
+            raise WorkflowError(
+                f"Missing required documents: {', '.join(missing_docs)}"
+            )
+
+        return {
+            "requirements": self._parse_document(
+                "requirements", documents["requirements"], self._parse_requirements
+            ),
+            "design": self._parse_document(
+                "design", documents["design"], self._parse_design
+            ),
+            "tasks": self._parse_document(
+                "tasks", documents["tasks"], self._parse_task_list
+            ),
+            "metadata": _freeze(metadata),
+            "spec_directory": str(spec_data.get("directory", "")),
+        }
+
+    def _parse_document(
+        self, doc_type: str, text: str, parser: Callable[[str], Any]
+    ) -> Any:
+        """
+        Parse a specification document, reusing the previous result when the
+        document text is unchanged.
+
+        Args:
+            doc_type: Document type the parse is cached under
+            text: Document text
+            parser: Parser for this document type
+
+        Returns:
+            Parsed document, frozen so it can be shared between loads
+        """
+        cached = self._parsed_documents.get(doc_type)
+        if cached is not None and cached[0] == text:
+            return cached[1]
+
+        parsed = _freeze(parser(text))
+        self._parsed_documents[doc_type] = (text, parsed)
+        return parsed
+
     def validate_context(self) -> ValidationResult:
         """
         Validate execution context before task execution.
 
+        The result is reused until the requirements, design or tasks in
+        context_cache are replaced, so assign new values rather than
+        mutating them in place to have them validated again.
+
         Returns:
             Validation result with any issues found
         """
@@ -216,6 +412,21 @@ class TaskExecutor(BaseManager):
 
             context = self.context_cache
 
+            # Reuse the last result while the validated parts were not replaced
+            parts = (
+                context.get("requirements"),
+                context.get("design"),
+                context.get("tasks"),
+            )
+            last = self._last_validation
+            if last is not None and all(a is b for a, b in zip(last[0], parts)):
+                result = last[1]
+                return replace(
+                    result,
+                    issues=list(result.issues),
+                    suggestions=list(result.suggestions),
+                )
+
             # Validate requirements
             if not context.get("requirements"):
                 issues.append("No requirements found in context")
@@ -244,20 +455,31 @@ class TaskExecutor(BaseManager):
 
             # Validate requirement traceability
             requirement_ids = {req.get("id") for req in context.get("requirements", [])}
-            for task in tasks:
-                task_req_refs = task.get("requirements_refs", [])
-                missing_refs = [
-                    ref for ref in task_req_refs if ref not in requirement_ids
-                ]
-                if missing_refs:
-                    issues.append(
-                        f"Task '{task.get('title')}' references missing requirements: {missing_refs}"
-                    )
-                    suggestions.append(
-                        "Update task requirement references or add missing requirements"
-                    )
+            referenced_ids = {
+                ref for task in tasks for ref in task.get("requirements_refs", [])
+            }
+
+            # Only look for the offending tasks when some reference is missing
+            if not requirement_ids.issuperset(referenced_ids):
+                for task in tasks:
+                    task_req_refs = task.get("requirements_refs", [])
+                    if not requirement_ids.issuperset(task_req_refs):
+                        missing_refs = [
+                            ref for ref in task_req_refs if ref not in requirement_ids
+                        ]
+                        issues.append(
+                            f"Task '{task.get('title')}' references missing requirements: {missing_refs}"
+                        )
+                        suggestions.append(
+                            "Update task requirement references or add missing requirements"
+                        )
 
-            return ValidationResult(len(issues) == 0, issues, suggestions)
+            result = ValidationResult(len(issues) == 0, issues, suggestions)
+            self._last_validation = (
+                parts,
+                replace(result, issues=list(issues), suggestions=list(suggestions)),
+            )
+            return result
 
         except Exception as e:
             return ValidationResult(
@@ -274,7 +496,9 @@ class TaskExecutor(BaseManager):
             task_id: ID of task to focus on
 
         Returns:
-            Task focus context with relevant information
+            Task focus context with relevant information. The task is a copy
+            the caller may modify; requirements and dependencies are
+            read-only views shared with the cached context.
         """
         try:
             # Ensure context is loaded
@@ -289,21 +513,24 @@ class TaskExecutor(BaseManager):
             # Set current task
             self.current_task = target_task
 
-            # Build focused context
+            # Build focused context around a mutable copy of the task, the
+            # part callers update while working on it
+            task = _thaw(target_task)
             focus_context = {
-                "task": target_task,
+                "task": task,
                 "related_requirements": self._get_task_requirements(target_task),
                 "dependencies": self._get_task_dependencies(target_task),
-                "sub_tasks": target_task.get("sub_tasks", []),
+                "sub_tasks": task.get("sub_tasks", []),
                 "scope": self._define_task_scope(target_task),
                 "validation_criteria": self._get_validation_criteria(target_task),
             }
 
-            # Update execution state
+            # Update execution state, deferring the write until flush_state()
             execution_state = self.load(self.feature_name) or {}
             execution_state["current_task_id"] = task_id
             execution_state["task_focused_at"] = self._get_timestamp()
-            self.update(self.feature_name, execution_state)
+            self._pending_state = (self.execution_state_file, execution_state)
+            _dirty_executors.add(self)
 
             return focus_context
 
@@ -318,7 +545,8 @@ class TaskExecutor(BaseManager):
             task_id: ID of task to get context for
 
         Returns:
-            Complete task execution context
+            Complete task execution context; the specification documents are
+            read-only views shared with the cached context
         """
         try:
             # Focus on task first
@@ -345,35 +573,27 @@ class TaskExecutor(BaseManager):
             requirements = []
 
             # Split into sections
-            sections = re.split(r"\n## ", requirements_text)
+            sections = _SECTION_RE.split(requirements_text)
 
             for section in sections:
                 if section.startswith("Requirements"):
                     # Parse individual requirements
-                    req_sections = re.split(r"\n### Requirement \d+", section)
+                    req_sections = _REQUIREMENT_HEADER_RE.split(section)
 
                     for i, req_section in enumerate(req_sections[1:], 1):  # Skip header
                         # Extract user story
-                        user_story_match = re.search(
-                            r"\*\*User Story:\*\* (.+)", req_section
-                        )
+                        user_story_match = _USER_STORY_RE.search(req_section)
                         user_story = (
                             user_story_match.group(1) if user_story_match else ""
                         )
 
                         # Extract acceptance criteria
-                        criteria_section = re.search(
-                            r"#### Acceptance Criteria\n\n(.+?)(?=\n###|\n##|\Z)",
-                            req_section,
-                            re.DOTALL,
-                        )
+                        criteria_text = _acceptance_criteria_text(req_section)
                         criteria = []
-                        if criteria_section:
-                            criteria_lines = (
-                                criteria_section.group(1).strip().split("\n")
-                            )
+                        if criteria_text is not None:
+                            criteria_lines = criteria_text.strip().split("\n")
                             criteria = [
-                                line.strip("1234567890. ")
+                                _LIST_PREFIX_RE.sub("", line).strip()
                                 for line in criteria_lines
                                 if line.strip()
                             ]
@@ -387,15 +607,17 @@ class TaskExecutor(BaseManager):
                             }
                         )
 
-                        # Add individual acceptance criteria as sub-requirements
-                        for j, criterion in enumerate(criteria, 1):
-                            requirements.append(
-                                {
-                                    "id": f"{i}.{j}",
-                                    "user_story": f"Acceptance criterion for requirement {i}",
-                                    "acceptance_criteria": [criterion],
-                                }
-                            )
+                        # Add individual acceptance criteria as sub-requirements,
+                        # sharing one user story string between them
+                        criterion_story = f"Acceptance criterion for requirement {i}"
+                        requirements.extend(
+                            {
+                                "id": f"{i}.{j}",
+                                "user_story": criterion_story,
+                                "acceptance_criteria": [criterion],
+                            }
+                            for j, criterion in enumerate(criteria, 1)
+                        )
 
             return requirements
 
@@ -415,23 +637,24 @@ class TaskExecutor(BaseManager):
                 "testing_strategy": "",
             }
 
-            # Split into sections
-            sections = re.split(r"\n## ", design_text)
-
-            for section in sections:
-                section_lower = section.lower()
-                if section_lower.startswith("overview"):
-                    design["overview"] = section
-                elif section_lower.startswith("architecture"):
-                    design["architecture"] = section
-                elif section_lower.startswith("components"):
-                    design["components"] = section
-                elif section_lower.startswith("data models"):
-                    design["data_models"] = section
-                elif section_lower.startswith("error handling"):
-                    design["error_handling"] = section
-                elif section_lower.startswith("testing"):
-                    design["testing_strategy"] = section
+            # Scan line by line, lowercasing only the section header lines
+            buckets: Dict[str, List[str]] = {}
+            current: Optional[List[str]] = None
+            for index, line in enumerate(design_text.split("\n")):
+                if index and not line.startswith("## "):
+                    if current is not None:
+                        current.append(line)
+                    continue
+                if index:
+                    line = line[3:]
+                key = _design_section_key(line)
+                if key is None:
+                    current = None
+                else:
+                    current = buckets[key] = [line]
+
+            for key, lines in buckets.items():
+                design[key] = "\n".join(lines)
 
             return design
 
@@ -444,15 +667,14 @@ class TaskExecutor(BaseManager):
         try:
             tasks: List[Dict[str, Any]] = []
 
-            # Split text into lines and process each line
-            lines = tasks_text.split("\n")
+            # Process the text line by line without building a list of lines
             current_task: Optional[Dict[str, Any]] = None
 
-            for line in lines:
+            for line in io.StringIO(tasks_text):
                 line = line.strip()
 
                 # Check for task line with checkbox
-                task_match = re.match(r"^- \[[ x]\] (\d+(?:\.\d+)?)\.?\s+(.+)", line)
+                task_match = _TASK_LINE_RE.match(line)
                 if task_match:
                     task_id = task_match.group(1)
                     title = task_match.group(2)
@@ -476,7 +698,7 @@ class TaskExecutor(BaseManager):
 
                 # Check for requirements reference
                 elif current_task and "_Requirements:" in line:
-                    req_refs = re.findall(r"_Requirements: ([^_]+)_", line)
+                    req_refs = _REQ_REF_RE.findall(line)
                     if req_refs:
                         requirements_refs = [
                             ref.strip() for ref in req_refs[0].split(",")
@@ -536,28 +758,49 @@ class TaskExecutor(BaseManager):
 
     def _find_task_by_id(self, task_id: str) -> Optional[Dict[str, Any]]:
         """Find task by ID in context."""
+        return self._index_tasks().get(task_id)
+
+    def _index_tasks(self) -> Dict[str, Dict[str, Any]]:
+        """Get the task and sub-task lookup for the cached task list."""
         tasks = self.context_cache.get("tasks", [])
+        if tasks is self._indexed_tasks:
+            return self._task_index
+
+        # Rebuild when the cached task list was replaced; first match wins
+        index = {}
         for task in tasks:
-            if isinstance(task, dict) and task.get("id") == task_id:
-                return task
-            # Check sub-tasks
-            if isinstance(task, dict):
+            if isinstance(task, Mapping):
+                index.setdefault(task.get("id"), task)
                 for sub_task in task.get("sub_tasks", []):
-                    if isinstance(sub_task, dict) and sub_task.get("id") == task_id:
-                        return sub_task
-        return None
+                    if isinstance(sub_task, Mapping):
+                        index.setdefault(sub_task.get("id"), sub_task)
+        self._indexed_tasks = tasks
+        self._task_index = index
+        return index
 
     def _get_task_requirements(self, task: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Get requirements related to specific task."""
-        req_refs = task.get("requirements_refs", [])
         requirements = self.context_cache.get("requirements", [])
-
-        related_reqs = []
-        for req in requirements:
-            if req.get("id") in req_refs:
-                related_reqs.append(req)
-
-        return related_reqs
+        if requirements is not self._indexed_requirements:
+            # Requirements were reloaded or replaced, so drop derived lookups
+            positions: Dict[Any, List[int]] = {}
+            for position, req in enumerate(requirements):
+                positions.setdefault(req.get("id"), []).append(position)
+            self._indexed_requirements = requirements
+            self._requirement_positions = positions
+            self._task_req_cache = {}
+
+        task_id = task.get("id")
+        cached = self._task_req_cache.get(task_id)
+        if cached is None or cached[0] is not task:
+            # Keep document order, as a scan over all requirements would
+            matched = set()
+            for ref in task.get("requirements_refs", []):
+                matched.update(self._requirement_positions.get(ref, ()))
+            cached = (task, [requirements[position] for position in sorted(matched)])
+            self._task_req_cache[task_id] = cached
+
+        return list(cached[1])
 
     def _get_task_dependencies(self, task: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Get task dependencies."""
@@ -588,14 +831,10 @@ class TaskExecutor(BaseManager):
         # For now, return basic deliverables based on task type
         title = task.get("title", "").lower()
 
-        if "implement" in title:
-            return ["Implementation code", "Unit tests (if required)"]
-        elif "create" in title:
-            return ["New component/module", "Documentation"]
-        elif "build" in title:
-            return ["Built component", "Integration tests"]
-        else:
-            return ["Task completion", "Code changes"]
+        for keyword, deliverables in _DELIVERABLES_BY_KEYWORD:
+            if keyword in title:
+                return list(deliverables)
+        return list(_DEFAULT_DELIVERABLES)
 
     def _extract_constraints(self, task: Dict[str, Any]) -> List[str]:
         """Extract constraints from task context."""
@@ -649,17 +888,60 @@ class TaskExecutor(BaseManager):
 
     def _get_timestamp(self) -> str:
         """Get current timestamp in ISO format."""
-        from datetime import datetime
-
         return datetime.now().isoformat()
 
-    def _save_execution_state(self, state: Dict[str, Any]) -> None:
-        """Save execution state to file."""
+    def _save_execution_state(
+        self, state: Dict[str, Any], state_file: Optional[Path] = None
+    ) -> None:
+        """
+        Save execution state to file, by default the executor's state file.
+
+        The write is skipped when the file still holds exactly what this
+        executor last wrote; otherwise the state goes to a temporary file
+        that is atomically renamed over the target.
+        """
         try:
-            # Ensure directory exists
-            self.execution_state_file.parent.mkdir(parents=True, exist_ok=True)
+            if state_file is None:
+                state_file = self.execution_state_file
+            path = str(state_file)
+            data = _STATE_ENCODER.encode(state)
+            if self._saved_state is not None and self._saved_state[:2] == (path, data):
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    pass
+                else:
+                    if (stat.st_mtime_ns, stat.st_size) == self._saved_state[2]:
+                        return
 
-            with open(self.execution_state_file, "w") as f:
-                json.dump(state, f, indent=2)
+            # Ensure directory exists
+            state_file.parent.mkdir(parents=True, exist_ok=True)
+
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            try:
+                with open(tmp_path, "w") as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            except BaseException:
+                with suppress(OSError):
+                    os.unlink(tmp_path)
+                raise
+
+            stat = os.stat(path)
+            self._saved_state = (path, data, (stat.st_mtime_ns, stat.st_size))
         except Exception as e:
             raise WorkflowError(f"Failed to save execution state: {e}")
+
+
+# Executors holding deferred state updates, kept alive until flushed
+_dirty_executors: Set[TaskExecutor] = set()
+
+
+@atexit.register
+def _flush_dirty_executors() -> None:
+    """Write the deferred execution state of all executors at exit."""
+    for executor in list(_dirty_executors):
+        try:
+            executor.flush_state()
+        except WorkflowError as e:
+            print(f"Error flushing execution state: {e}")
@@ -5,9 +5,11 @@ Tests complete system integration with Kiro infrastructure,
 error handling, recovery mechanisms, and real-world scenarios.
 """
 
+import errno
 import json
 import pytest
 import tempfile
+from dataclasses import asdict
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 
@@ -26,6 +28,7 @@ from packages.feature_planning import (
     ErrorSeverity,
     handle_error,
 )
+from packages.feature_planning.base import WorkflowError
 
 
 class TestKiroIntegrationManager:
@@ -67,6 +70,102 @@ class TestKiroIntegrationManager:
         assert final_read.success
         assert append_content in final_read.data
     
+    def test_file_system_adapter_batched_writes(self):
+        """Test that batched writes are deferred until the batch exits"""
+        adapter = self.integration_manager.file_system
+        test_path = f"{self.temp_dir}/nested/batched.md"
+
+        with adapter.batch():
+            assert adapter.write_file(test_path, "# Title\n").success
+            assert adapter.append_file(test_path, "line 1\n").success
+            assert adapter.append_file(test_path, "line 2\n").success
+
+            # Nothing is on disk yet, but the adapter knows about the file
+            assert not Path(test_path).exists()
+            assert adapter.file_exists(test_path)
+
+        assert Path(test_path).read_text() == "# Title\nline 1\nline 2\n"
+        assert len(adapter.get_operations_log()) == 3
+
+    def test_file_system_adapter_batch_reports_failed_flush(
+        self, monkeypatch, tmp_path
+    ):
+        """Test that a buffered write failing on flush is not reported as success"""
+        monkeypatch.chdir(tmp_path)
+        disk_full = OSError(errno.ENOSPC, "No space left on device")
+
+        with patch(
+            "packages.feature_planning.kiro_integration._write_text",
+            side_effect=disk_full,
+        ):
+            result = self.integration_manager.create_feature_spec("feat", "An idea")
+
+            assert not result.success
+            assert "No space left on device" in result.error
+            assert not (tmp_path / ".kiro/specs/feat/metadata.json").exists()
+
+            adapter = self.integration_manager.file_system
+            with adapter.batch():
+                adapter.write_file(str(tmp_path / "late.md"), "late")
+                result = self.integration_manager.execute_task("feat", "1")
+            assert not result.success
+            assert "No space left on device" in result.error
+
+            with pytest.raises(WorkflowError, match="No space left on device"):
+                with adapter.batch():
+                    adapter.write_file(str(tmp_path / "late.md"), "late")
+
+    def test_file_system_adapter_read_flushes_pending(self):
+        """Test that reading a buffered path sees its pending content"""
+        adapter = self.integration_manager.file_system
+        test_path = f"{self.temp_dir}/pending.md"
+
+        with adapter.batch():
+            adapter.write_file(test_path, "pending content")
+            read_result = adapter.read_file(test_path)
+
+        assert read_result.success
+        assert read_result.data == "pending content"
+
+    def test_file_system_adapter_read_cache_invalidation(self):
+        """Test that cached reads are refreshed after writes"""
+        adapter = self.integration_manager.file_system
+        test_path = f"{self.temp_dir}/cached.md"
+
+        adapter.write_file(test_path, "first")
+        assert adapter.read_file(test_path).data == "first"
+        assert adapter.read_file(test_path).data == "first"
+
+        adapter.write_file(test_path, "second version")
+        assert adapter.read_file(test_path).data == "second version"
+
+        assert not adapter.file_exists(f"{self.temp_dir}/missing.md")
+
+    def test_file_system_adapter_recreates_removed_directory(self):
+        """Test that writes succeed after a cached directory is removed"""
+        import shutil
+
+        adapter = self.integration_manager.file_system
+        test_dir = f"{self.temp_dir}/removed"
+        test_path = f"{test_dir}/file.md"
+
+        assert adapter.write_file(test_path, "first").success
+        shutil.rmtree(test_dir)
+
+        assert adapter.write_file(test_path, "second").success
+        assert Path(test_path).read_text() == "second"
+
+    def test_file_system_adapter_atomic_write_leaves_no_temp_files(self):
+        """Test that full rewrites do not leave temporary files behind"""
+        adapter = self.integration_manager.file_system
+        test_path = f"{self.temp_dir}/atomic.md"
+
+        adapter.write_file(test_path, "first")
+        adapter.write_file(test_path, "second")
+
+        assert Path(test_path).read_text() == "second"
+        assert [p.name for p in Path(self.temp_dir).iterdir()] == ["atomic.md"]
+
     def test_user_input_adapter_integration(self):
         """Test user input adapter operations"""
         adapter = self.integration_manager.user_input
@@ -88,6 +187,22 @@ class TestKiroIntegrationManager:
         assert history[0]['reason'] == reason
         assert history[0]['options'] == options
     
+    def test_history_views_are_reused_until_changed(self):
+        """Test history accessors reuse their read-only records until a change"""
+        adapter = self.integration_manager.user_input
+        adapter.request_approval("First?", "review")
+
+        history = adapter.get_input_history()
+        assert adapter.get_input_history() is history
+        with pytest.raises(TypeError):
+            history[0]["question"] = "Changed?"
+
+        adapter.request_approval("Second?", "review")
+        assert [r["question"] for r in adapter.get_input_history()] == [
+            "First?",
+            "Second?",
+        ]
+
     def test_task_status_adapter_integration(self):
         """Test task status adapter operations"""
         adapter = self.integration_manager.task_status
@@ -180,6 +295,18 @@ class TestKiroIntegrationManager:
             # Verify task status was updated twice (in_progress, then completed)
             assert mock_status.call_count == 2
     
+    def test_bulk_execute_coalesces_status_updates(self):
+        """Test that bulk execution emits one status update per task"""
+        task_ids = ["1.1 Create base interfaces", "1.2 Add validation"]
+
+        result = self.integration_manager.bulk_execute(self.feature_name, task_ids)
+
+        assert result.success
+        assert result.data["task_ids"] == task_ids
+        updates = self.integration_manager.task_status.get_status_updates()
+        assert [u["task"] for u in updates] == task_ids
+        assert all(u["status"] == "completed" for u in updates)
+
     def test_integration_status_reporting(self):
         """Test integration status reporting"""
         # Perform some operations to generate history
@@ -197,6 +324,52 @@ class TestKiroIntegrationManager:
         assert status['user_input']['requests_count'] == 1
         assert status['task_status']['updates_count'] == 1
 
+    def test_integration_status_cache_invalidation(self):
+        """Test that cached status is rebuilt after adapter mutations"""
+        first = self.integration_manager.get_integration_status()
+        cached = self.integration_manager._status_cache
+        assert self.integration_manager.get_integration_status() == first
+        assert self.integration_manager._status_cache is cached
+
+        self.integration_manager.user_input.request_approval("ok?", "test")
+        second = self.integration_manager.get_integration_status()
+
+        assert self.integration_manager._status_cache is not cached
+        assert second["user_input"]["requests_count"] == 1
+
+    def test_integration_status_is_not_changed_by_callers(self):
+        """Test that editing a returned status leaves later calls intact"""
+        self.integration_manager.file_system.write_file(f"{self.temp_dir}/a.md", "a")
+        status = self.integration_manager.get_integration_status()
+
+        status["file_system"]["operations_count"] = 99
+        with pytest.raises(AttributeError):
+            status["file_system"]["last_operations"].append({"path": "bogus"})
+        with pytest.raises(TypeError):
+            status["file_system"]["last_operations"][0]["path"] = "bogus"
+
+        status = self.integration_manager.get_integration_status()
+        assert status["file_system"]["operations_count"] == 1
+        assert status["file_system"]["last_operations"][0]["path"].endswith("a.md")
+
+    def test_adapter_history_is_bounded(self):
+        """Test that adapter histories keep only the most recent records"""
+        from packages.feature_planning.kiro_integration import _HISTORY_SIZE
+
+        adapter = self.integration_manager.task_status
+        for i in range(_HISTORY_SIZE + 10):
+            adapter.update_task_status("tasks.md", f"task{i}", "completed")
+
+        assert len(adapter.get_status_updates()) == _HISTORY_SIZE
+        status = self.integration_manager.get_integration_status()
+        assert status["task_status"]["updates_count"] == _HISTORY_SIZE + 10
+        recent = adapter.get_recent(3)
+        assert [u["task"] for u in recent] == [
+            f"task{_HISTORY_SIZE + 7}",
+            f"task{_HISTORY_SIZE + 8}",
+            f"task{_HISTORY_SIZE + 9}",
+        ]
+
 
 class TestSystemConfiguration:
     """Test system configuration and initialization"""
@@ -240,7 +413,7 @@ class TestSystemConfiguration:
             assert mock_dump.called
             
             # Test load configuration
-            mock_load.return_value = self.config.__dict__
+            mock_load.return_value = asdict(self.config)
             loaded_config = initializer.load_configuration()
             assert loaded_config is not None
     
@@ -262,6 +435,209 @@ class TestSystemConfiguration:
             assert 'templates_exist' in status
             assert 'healthy' in status
 
+    def test_system_status_reports_missing_template(self):
+        """Test status lists templates missing from the templates directory"""
+        from packages.feature_planning.system_config import SystemInitializer
+
+        initializer = SystemInitializer(self.config)
+        initializer.config_file = (
+            Path(self.temp_dir) / "settings" / "feature_planning.json"
+        )
+        assert initializer.initialize_system()
+        assert initializer.get_system_status()["healthy"]
+
+        (Path(self.config.templates_directory) / "design_template.md").unlink()
+
+        status = initializer.get_system_status()
+        assert not status["templates_exist"]
+        assert "Missing templates: design_template.md" in status["errors"]
+
+    def test_initialize_rewrites_only_incomplete_configuration(self):
+        """Test re-initialization keeps a complete configuration file as is"""
+        from packages.feature_planning.system_config import SystemInitializer
+
+        initializer = SystemInitializer(self.config)
+        initializer.config_file = (
+            Path(self.temp_dir) / "settings" / "feature_planning.json"
+        )
+        assert initializer.initialize_system()
+        written = initializer.config_file.read_text()
+
+        data = json.loads(written)
+        data["log_level"] = "DEBUG"
+        initializer.config_file.write_text(json.dumps(data))
+        assert initializer.initialize_system()
+        assert initializer.config_file.read_text() == json.dumps(data)
+        assert initializer.config.log_level == "DEBUG"
+
+        del data["debug_mode"]
+        initializer.config_file.write_text(json.dumps(data))
+        assert initializer.initialize_system()
+        assert json.loads(initializer.config_file.read_text())["debug_mode"] is False
+
+    def test_update_configuration(self):
+        """Test configuration updates reach the initializer and reject unknown keys"""
+        system = FeaturePlanningSystem(self.config)
+        system.initializer.config_file = (
+            Path(self.temp_dir) / "settings" / "feature_planning.json"
+        )
+
+        assert system.update_configuration(log_level="DEBUG")
+        assert system.get_configuration().log_level == "DEBUG"
+        assert system.initializer.config.log_level == "DEBUG"
+        assert self.config.log_level == "INFO"
+
+        assert not system.update_configuration(no_such_setting=True)
+        assert system.get_configuration().log_level == "DEBUG"
+
+    def test_reassigned_configuration_moves_templates(self):
+        """Test paths derived from the configuration follow reassignment"""
+        from packages.feature_planning.system_config import SystemInitializer
+
+        initializer = SystemInitializer(self.config)
+        moved = SystemConfiguration(
+            specs_directory=self.config.specs_directory,
+            templates_directory=f"{self.temp_dir}/moved-templates",
+            backup_directory=self.config.backup_directory,
+        )
+        initializer.config = moved
+
+        initializer._create_directories()
+        initializer._create_default_templates()
+
+        assert (Path(moved.templates_directory) / "tasks_template.md").exists()
+        assert not Path(self.config.templates_directory).exists()
+
+    def test_system_info_follows_configuration_updates(self):
+        """Test system info reports the current configuration as a fresh dict"""
+        system = FeaturePlanningSystem(self.config)
+        system.initializer.config_file = (
+            Path(self.temp_dir) / "settings" / "feature_planning.json"
+        )
+
+        info = system.get_system_info()
+        info["configuration"]["log_level"] = "TRACE"
+        assert system.get_system_info()["configuration"]["log_level"] == "INFO"
+
+        assert system.update_configuration(log_level="DEBUG")
+        assert system.get_system_info()["configuration"]["log_level"] == "DEBUG"
+
+    def test_global_system_instance(self):
+        """Test the global system is created once until explicitly reset"""
+        from packages.feature_planning.system_config import get_system
+
+        system = get_system()
+        assert get_system() is system
+
+        get_system.cache_clear()
+        assert get_system() is not system
+
+    def test_reinitialize_restores_removed_template(self):
+        """Test re-initialization writes back a template removed after the first run"""
+        from packages.feature_planning.system_config import SystemInitializer
+
+        initializer = SystemInitializer(self.config)
+        initializer.config_file = (
+            Path(self.temp_dir) / "settings" / "feature_planning.json"
+        )
+        assert initializer.initialize_system()
+
+        template = Path(self.config.templates_directory) / "design_template.md"
+        content = template.read_bytes()
+        template.unlink()
+
+        assert initializer.initialize_system()
+        assert template.read_bytes() == content
+
+    def test_initialize_over_existing_templates(self):
+        """Test initialization keeps templates already on disk from an earlier run"""
+        from packages.feature_planning.system_config import SystemInitializer
+
+        initializer = SystemInitializer(self.config)
+        initializer.config_file = (
+            Path(self.temp_dir) / "settings" / "feature_planning.json"
+        )
+        assert initializer.initialize_system()
+
+        template = Path(self.config.templates_directory) / "design_template.md"
+        template.write_text("custom")
+
+        # A new initializer has not seen the templates written above
+        initializer = SystemInitializer(self.config)
+        initializer.config_file = (
+            Path(self.temp_dir) / "settings" / "feature_planning.json"
+        )
+        assert initializer.initialize_system()
+        assert template.read_text() == "custom"
+
+    def test_load_configuration_ignores_unknown_settings(self):
+        """Test settings missing from the schema do not fail the load"""
+        from packages.feature_planning.system_config import SystemInitializer
+
+        initializer = SystemInitializer(self.config)
+        initializer.config_file = (
+            Path(self.temp_dir) / "settings" / "feature_planning.json"
+        )
+        initializer.config_file.parent.mkdir(parents=True)
+        data = asdict(self.config)
+        data["retired_setting"] = 1
+        initializer.config_file.write_text(json.dumps(data))
+
+        assert initializer.load_configuration() == self.config
+
+    def test_create_directories(self):
+        """Test nested and already existing directories are created once"""
+        from packages.feature_planning.system_config import SystemInitializer
+
+        self.config.backup_directory = f"{self.temp_dir}/.kiro/backups/nested/deeper"
+        Path(self.config.specs_directory).mkdir(parents=True)
+        initializer = SystemInitializer(self.config)
+
+        initializer._create_directories()
+        initializer._create_directories()
+
+        for directory in (
+            self.config.specs_directory,
+            self.config.templates_directory,
+            self.config.backup_directory,
+        ):
+            assert Path(directory).is_dir()
+
+    def test_initialize_fails_when_file_blocks_directory(self):
+        """Test a regular file where a directory belongs fails initialization"""
+        from packages.feature_planning.system_config import SystemInitializer
+
+        Path(self.config.specs_directory).parent.mkdir(parents=True)
+        Path(self.config.specs_directory).touch()
+        initializer = SystemInitializer(self.config)
+        initializer.config_file = (
+            Path(self.temp_dir) / "settings" / "feature_planning.json"
+        )
+
+        with pytest.raises(FileExistsError):
+            initializer._create_directories()
+        assert not initializer.initialize_system()
+
+    def test_configuration_reload_after_external_change(self):
+        """Test cached configuration is re-read when the file changes"""
+        from packages.feature_planning.system_config import SystemInitializer
+
+        initializer = SystemInitializer(self.config)
+        initializer.config_file = (
+            Path(self.temp_dir) / "settings" / "feature_planning.json"
+        )
+
+        assert initializer.save_configuration(self.config)
+        loaded = initializer.load_configuration()
+        assert loaded == self.config
+        assert loaded is not initializer.load_configuration()
+
+        data = json.loads(initializer.config_file.read_text())
+        data["log_level"] = "DEBUG"
+        initializer.config_file.write_text(json.dumps(data, indent=4))
+
+        assert initializer.load_configuration().log_level == "DEBUG"
+
 
 class TestErrorHandlingIntegration:
     """Test error handling and recovery mechanisms"""
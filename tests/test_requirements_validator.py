@@ -7,6 +7,11 @@ Tests all INCOSE quality rules, glossary management, and validation scenarios.
 import pytest
 from packages.feature_planning.requirements_validator import RequirementsValidator
 from packages.feature_planning.base import ValidationResult, QualityIssue
+from packages.feature_planning.config import (
+    FeaturePlanningConfig,
+    get_config,
+    set_config,
+)
 
 
 class TestRequirementsValidator:
@@ -91,6 +96,49 @@ class TestRequirementsValidator:
             assert len(escape_issues) > 0
             assert "escape clause" in escape_issues[0].description.lower()
     
+    def test_multiple_escape_clauses_reported_once_each(self):
+        """Test that each distinct escape clause is reported exactly once."""
+        req = (
+            "THE System SHALL log errors where possible, "
+            "retry AS MUCH AS POSSIBLE and alert where possible"
+        )
+        issues = self.validator.check_incose_rules(req)
+        escape_descriptions = sorted(
+            issue.description for issue in issues if issue.rule == "no_escape_clauses"
+        )
+        assert escape_descriptions == [
+            "Escape clause detected: 'as much as possible'",
+            "Escape clause detected: 'where possible'",
+        ]
+    
+    def test_empty_requirement_reported(self):
+        """Test that blank requirements produce a single issue."""
+        for req in ["", "   \n\t"]:
+            issues = self.validator.check_incose_rules(req)
+            assert [issue.rule for issue in issues] == ["not_empty"]
+            assert not self.validator.validate(req).is_valid
+    
+    def test_rules_follow_global_config(self):
+        """Test that rule data is shared per config and follows set_config."""
+        original = get_config()
+        assert RequirementsValidator().incose_rules is self.validator.incose_rules
+        try:
+            set_config(FeaturePlanningConfig())
+            assert (
+                RequirementsValidator().incose_rules is not self.validator.incose_rules
+            )
+        finally:
+            set_config(original)
+    
+    def test_repeated_check_returns_independent_results(self):
+        """Test that cached results are returned as fresh lists."""
+        req = "THE System SHALL respond quickly where possible"
+        first = self.validator.check_incose_rules(req)
+        first.clear()
+        second = self.validator.check_incose_rules(req)
+        assert second
+        assert second == self.validator.check_incose_rules(req)
+    
     def test_negative_statements_detection(self):
         """Test detection of negative requirements."""
         # Valid positive requirement
@@ -267,6 +315,17 @@ class TestGlossaryValidation:
         issues_text = " ".join(result.issues)
         assert "circular reference" in issues_text.lower()
     
+    def test_circular_reference_reports_original_spelling(self):
+        """Test that lowercase references resolve to the glossary spelling."""
+        glossary = {
+            "System": "Main component that queries the database",
+            "Database": "Storage component used by the system",
+        }
+
+        result = self.validator.validate_glossary(glossary)
+        assert "Circular reference between 'System' and 'Database'" in result.issues
+        assert "Circular reference between 'Database' and 'System'" in result.issues
+    
     def test_technical_term_detection(self):
         """Test automatic detection of technical terms."""
         requirements_text = """
@@ -316,6 +375,16 @@ class TestGlossaryValidation:
         result = self.validator.check_glossary_consistency(requirements_text, glossary)
         issues_text = " ".join(result.issues)
         assert "inconsistent capitalization" in issues_text.lower()
+    
+    def test_capitalization_of_overlapping_terms(self):
+        """Test that terms nested inside longer glossary terms are still checked."""
+        requirements_text = "THE api Gateway SHALL route API calls."
+        glossary = {"API": "Public interface", "API Gateway": "Request router"}
+
+        result = self.validator.check_glossary_consistency(requirements_text, glossary)
+        issues_text = " ".join(result.issues)
+        assert "capitalization of 'API'" in issues_text
+        assert "not used in requirements" not in issues_text
 
 
 class TestIntegrationScenarios:
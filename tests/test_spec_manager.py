@@ -103,6 +103,26 @@ class TestSpecManagerIntegration:
         metadata = loaded_spec["metadata"]
         assert metadata["feature_name"] == self.test_feature_name
     
+    def test_load_returns_fresh_metadata(self):
+        """Test that loaded metadata is independent and tracks file changes."""
+        self.spec_manager.create(self.test_feature_name)
+
+        first = self.spec_manager.load(self.test_feature_name)["metadata"]
+        first["feature_name"] = "mutated"
+        assert (
+            self.spec_manager.load(self.test_feature_name)["metadata"]["feature_name"]
+            == self.test_feature_name
+        )
+
+        # External edits are picked up on the next load
+        metadata_file = self.temp_dir / self.test_feature_name / "metadata.json"
+        metadata = json.loads(metadata_file.read_text())
+        metadata["current_phase"] = "externally-edited-phase"
+        metadata_file.write_text(json.dumps(metadata))
+
+        loaded = self.spec_manager.load(self.test_feature_name)["metadata"]
+        assert loaded["current_phase"] == "externally-edited-phase"
+    
     def test_load_nonexistent_specification(self):
         """Test loading specification that doesn't exist."""
         result = self.spec_manager.load("nonexistent-feature")
@@ -131,6 +151,38 @@ class TestSpecManagerIntegration:
         metadata = loaded_spec["metadata"]
         assert "last_modified" in metadata
     
+    def test_update_leaves_metadata_file_untouched(self):
+        """Test that timestamp updates go to the sidecar, not metadata.json."""
+        self.spec_manager.create(self.test_feature_name)
+        metadata_file = self.temp_dir / self.test_feature_name / "metadata.json"
+        original = metadata_file.read_text()
+
+        update_data = {"document_type": "design", "content": "# Design"}
+        assert self.spec_manager.update(self.test_feature_name, update_data) is True
+
+        assert metadata_file.read_text() == original
+        loaded = self.spec_manager.load(self.test_feature_name)
+        assert "last_modified" in loaded["metadata"]
+        datetime.fromisoformat(loaded["metadata"]["last_modified"])
+    
+    def test_update_timestamp_goes_through_file_adapter(self):
+        """Test that the timestamp sidecar follows metadata buffered by the adapter."""
+        from packages.feature_planning.kiro_integration import KiroFileSystemAdapter
+
+        adapter = KiroFileSystemAdapter()
+        self.spec_manager._file_adapter = adapter
+        spec_dir = self.temp_dir / self.test_feature_name
+        update_data = {"document_type": "design", "content": "# Design"}
+
+        with adapter.batch():
+            assert self.spec_manager.create(self.test_feature_name)
+            assert not (spec_dir / "metadata.json").exists()
+            assert self.spec_manager.update(self.test_feature_name, update_data)
+            assert adapter.file_exists(str(spec_dir / "metadata.timestamp"))
+
+        loaded = self.spec_manager.load(self.test_feature_name)
+        datetime.fromisoformat(loaded["metadata"]["last_modified"])
+    
     def test_update_metadata(self):
         """Test updating specification metadata."""
         # Create specification
@@ -194,6 +246,16 @@ class TestSpecManagerIntegration:
         # Verify sorted order
         assert specs == sorted(feature_names)
     
+    def test_list_specifications_skips_invalid_directories(self):
+        """Test that incomplete directories and stray files are not listed."""
+        self.spec_manager.create("complete-feature")
+        self.spec_manager.create("broken-metadata")
+        (self.temp_dir / "broken-metadata" / "metadata.json").write_text("{not json")
+        (self.temp_dir / "empty-dir").mkdir()
+        (self.temp_dir / "stray.txt").write_text("not a spec")
+
+        assert self.spec_manager.list_specifications() == ["complete-feature"]
+    
     def test_delete_specification(self):
         """Test deleting specification and all documents."""
         # Create specification
@@ -210,6 +272,18 @@ class TestSpecManagerIntegration:
         result = self.spec_manager.delete("nonexistent")
         assert result is False
     
+    def test_delete_keeps_final_backup(self):
+        """Test that deleted specifications are preserved in the backups area."""
+        self.spec_manager.create(self.test_feature_name)
+
+        assert self.spec_manager.delete(self.test_feature_name) is True
+
+        backup_dir = self.temp_dir / ".backups" / self.test_feature_name
+        final_backups = list(backup_dir.glob("final_backup_*"))
+        assert len(final_backups) == 1
+        assert (final_backups[0] / "requirements.md").exists()
+        assert (final_backups[0] / "metadata.json").exists()
+    
     def test_backup_document(self):
         """Test document backup functionality."""
         # Create specification
@@ -243,7 +317,18 @@ class TestSpecManagerIntegration:
         with open(backup_file, 'r') as f:
             backup_content = f.read()
         assert "Original content" in backup_content
-    
+
+    def test_backup_after_backup_directory_removed(self):
+        """Test backups recreate a backup directory removed behind the manager."""
+        self.spec_manager.create(self.test_feature_name)
+        assert self.spec_manager.backup_document(self.test_feature_name, "requirements")
+
+        backup_dir = self.temp_dir / ".backups" / self.test_feature_name
+        shutil.rmtree(backup_dir)
+
+        assert self.spec_manager.backup_document(self.test_feature_name, "requirements")
+        assert len(list(backup_dir.glob("requirements_*.backup"))) == 1
+
     def test_backup_history(self):
         """Test backup history tracking."""
         # Create specification and content
@@ -336,7 +421,26 @@ class TestSpecManagerIntegration:
         # Verify version names
         version_names_found = [v["version_name"] for v in versions]
         assert set(version_names_found) == set(version_names)
-    
+
+    def test_list_many_versions(self):
+        """Test listing enough versions to read them in parallel."""
+        self.spec_manager.create(self.test_feature_name)
+
+        version_names = [f"v{i}" for i in range(10)]
+        for version_name in version_names:
+            self.spec_manager.create_version_snapshot(
+                self.test_feature_name, version_name
+            )
+
+        # A version directory without an info file is skipped
+        versions_dir = self.temp_dir / self.test_feature_name / ".versions"
+        (versions_dir / "incomplete").mkdir()
+
+        versions = self.spec_manager.list_versions(self.test_feature_name)
+        assert {v["version_name"] for v in versions} == set(version_names)
+        created = [v["created_at"] for v in versions]
+        assert created == sorted(created, reverse=True)
+
     def test_rollback_to_version(self):
         """Test rollback functionality."""
         # Create specification
@@ -405,6 +509,38 @@ class TestSpecManagerIntegration:
         loaded_spec = self.spec_manager.load(self.test_feature_name)
         assert "Original content" in loaded_spec["documents"]["requirements"]
     
+    def test_restore_of_current_content_is_noop(self):
+        """Test that restoring a backup identical to the document skips the copy."""
+        self.spec_manager.create(self.test_feature_name)
+        update_data = {"document_type": "requirements", "content": "# Original"}
+        self.spec_manager.update(self.test_feature_name, update_data)
+        update_data["content"] = "# Modified"
+        self.spec_manager.update(self.test_feature_name, update_data)
+
+        history = self.spec_manager.get_backup_history(
+            self.test_feature_name, "requirements"
+        )
+        backup_filename = history[0]["filename"]
+        assert self.spec_manager.restore_from_backup(
+            self.test_feature_name, "requirements", backup_filename
+        )
+        backups_after_restore = len(
+            self.spec_manager.get_backup_history(self.test_feature_name, "requirements")
+        )
+
+        # The document now matches the backup, so no pre-restore backup is taken
+        assert self.spec_manager.restore_from_backup(
+            self.test_feature_name, "requirements", backup_filename
+        )
+        assert (
+            len(
+                self.spec_manager.get_backup_history(
+                    self.test_feature_name, "requirements"
+                )
+            )
+            == backups_after_restore
+        )
+    
     def test_error_handling(self):
         """Test error handling for various failure scenarios."""
         # Test invalid document type
@@ -444,7 +580,19 @@ class TestSpecManagerIntegration:
         
         metadata_path = self.spec_manager.get_document_path(self.test_feature_name, "metadata")
         assert metadata_path == self.temp_dir / self.test_feature_name / "metadata.json"
-    
+
+    def test_document_path_follows_base_path(self):
+        """Test cached document paths are rebuilt after base_path changes."""
+        self.spec_manager.get_document_path(self.test_feature_name, "design")
+
+        new_base = self.temp_dir / "moved"
+        self.spec_manager.base_path = new_base
+
+        design_path = self.spec_manager.get_document_path(
+            self.test_feature_name, "design"
+        )
+        assert design_path == new_base / self.test_feature_name / "design.md"
+
     def test_backup_cleanup(self):
         """Test automatic cleanup of old backups."""
         # Create specification
@@ -462,4 +610,20 @@ class TestSpecManagerIntegration:
         # Verify cleanup occurred (should keep only 10 most recent)
         backup_dir = self.temp_dir / ".backups" / self.test_feature_name
         backup_files = list(backup_dir.glob("requirements_*.backup"))
-        assert len(backup_files) <= 10
\ No newline at end of file
+        assert len(backup_files) <= 10
+
+    def test_backup_cleanup_after_backups_removed(self):
+        """Test cleanup recovers when tracked backups are removed externally."""
+        self.spec_manager.create(self.test_feature_name)
+        for _ in range(10):
+            self.spec_manager.backup_document(self.test_feature_name, "requirements")
+
+        backup_dir = self.temp_dir / ".backups" / self.test_feature_name
+        backup_files = sorted(backup_dir.glob("requirements_*.backup"))
+        for backup_file in backup_files[:5]:
+            backup_file.unlink()
+
+        for _ in range(8):
+            self.spec_manager.backup_document(self.test_feature_name, "requirements")
+
+        assert len(list(backup_dir.glob("requirements_*.backup"))) == 10
\ No newline at end of file
@@ -268,6 +268,42 @@ class TestTaskExecutor(TestTaskExecutionFramework):
         assert result.is_valid is True
         assert len(result.issues) == 0
     
+    def test_validate_context_reports_missing_requirement_refs(self):
+        """Test only tasks with unknown requirement references are reported."""
+        executor = self._setup_executor()
+        executor.context_cache = {
+            "requirements": [{"id": "1"}, {"id": "1.1"}],
+            "design": {"overview": "Overview"},
+            "tasks": [
+                {"id": "1", "title": "Known", "requirements_refs": ["1.1"]},
+                {"id": "2", "title": "Unknown", "requirements_refs": ["9", "1", "8"]},
+            ],
+        }
+
+        result = executor.validate_context()
+        assert result.is_valid is False
+        assert result.issues == [
+            "Task 'Unknown' references missing requirements: ['9', '8']"
+        ]
+    
+    def test_validate_context_reuses_result_until_replaced(self):
+        """Test validation is recomputed only after the context is replaced."""
+        executor = self._setup_executor()
+        executor.context_cache = {
+            "requirements": [{"id": "1"}],
+            "design": {"overview": "Overview"},
+            "tasks": [{"id": "1", "title": "Task", "requirements_refs": ["1"]}],
+        }
+
+        first = executor.validate_context()
+        first.issues.append("caller note")
+        assert executor.validate_context().issues == []
+
+        executor.context_cache["tasks"] = [
+            {"id": "2", "title": "Task", "requirements_refs": ["2"]}
+        ]
+        assert executor.validate_context().is_valid is False
+    
     def test_focus_on_task(self):
         """Test focusing execution on specific task."""
         executor = self._setup_executor()
@@ -288,6 +324,27 @@ class TestTaskExecutor(TestTaskExecutionFramework):
         assert executor.current_task is not None
         assert executor.current_task["id"] == task_id
     
+    def test_focus_on_task_defers_state_write(self):
+        """Test focusing batches its state update until the state is flushed."""
+        executor = self._setup_executor()
+        executor.create(self.feature_name)
+        executor.load_execution_context()
+
+        with patch(
+            "packages.feature_planning.task_executor.os.replace"
+        ) as mock_replace:
+            executor.focus_on_task("1")
+            executor.focus_on_task("2.1")
+        assert not mock_replace.called
+
+        # Reads see the deferred update before it reaches the disk
+        state_file = executor.execution_state_file
+        assert executor.load(self.feature_name)["current_task_id"] == "2.1"
+
+        assert executor.flush_state() is True
+        assert json.loads(state_file.read_text())["current_task_id"] == "2.1"
+        assert executor.flush_state() is False
+    
     def test_get_task_context(self):
         """Test getting complete task execution context."""
         executor = self._setup_executor()
@@ -305,6 +362,131 @@ class TestTaskExecutor(TestTaskExecutionFramework):
         assert "all_tasks" in task_context
         assert "feature_metadata" in task_context
     
+    def test_update_skips_unchanged_execution_state(self):
+        """Test unchanged execution state is not rewritten unless the file changed."""
+        executor = self._setup_executor()
+        executor.create(self.feature_name)
+        state = executor.load(self.feature_name)
+
+        with patch(
+            "packages.feature_planning.task_executor.os.replace"
+        ) as mock_replace:
+            assert executor.update(self.feature_name, state) is True
+        assert not mock_replace.called
+
+        # A file changed behind the executor's back is written again
+        executor.execution_state_file.write_text("{}")
+        assert executor.update(self.feature_name, state) is True
+        assert executor.load(self.feature_name) == state
+        assert not list(self.spec_dir.glob("*.tmp"))
+    
+    def test_load_execution_context_reuses_unchanged_spec(self):
+        """Test reloading context only re-parses documents that changed on disk."""
+        executor = self._setup_executor()
+        executor.create(self.feature_name)
+        first = executor.load_execution_context()
+
+        with patch.object(executor.spec_manager, "load") as mock_load:
+            second = executor.load_execution_context()
+        assert not mock_load.called
+        assert second["tasks"] == first["tasks"]
+
+        # Editing a document re-parses only that document
+        tasks_file = self.spec_dir / "tasks.md"
+        tasks_file.write_text(
+            tasks_file.read_text() + "\n- [ ] 4. Document the framework\n"
+        )
+        with patch.object(
+            executor, "_parse_requirements", wraps=executor._parse_requirements
+        ) as mock_parse:
+            third = executor.load_execution_context()
+        assert not mock_parse.called
+        assert third["tasks"][-1]["id"] == "4"
+        assert third["requirements"] == first["requirements"]
+        assert executor._find_task_by_id("4") is third["tasks"][-1]
+    
+    def test_task_context_edits_do_not_leak_into_later_loads(self):
+        """Test edits to returned task contexts do not reach the cache."""
+        executor = self._setup_executor()
+        executor.create(self.feature_name)
+        context = executor.load_execution_context()
+
+        # Shared documents are read-only; the focused task is a copy
+        with pytest.raises(TypeError):
+            context["tasks"][0]["status"] = "edited"
+        task_context = executor.get_task_context("1")
+        with pytest.raises(AttributeError):
+            task_context["all_tasks"][0]["requirements_refs"].append("99")
+        task_context["task"]["status"] = "completed"
+        task_context["task"]["requirements_refs"].append("99")
+        executor.focus_on_task("1")["task"]["title"] = ""
+
+        assert executor.validate_context().is_valid
+        assert executor.current_task["status"] == "not_started"
+        reloaded = executor.load_execution_context()
+        assert reloaded["tasks"] is context["tasks"]
+        assert reloaded["tasks"][0]["status"] == "not_started"
+        assert "99" not in reloaded["tasks"][0]["requirements_refs"]
+        assert reloaded["tasks"][0]["title"]
+    
+    def test_task_requirements_follow_context(self):
+        """Test related requirements keep document order and follow reloads."""
+        executor = self._setup_executor()
+        executor.context_cache["requirements"] = [
+            {"id": "1", "user_story": "First"},
+            {"id": "1.1", "user_story": "Criterion"},
+            {"id": "2", "user_story": "Second"},
+        ]
+        task = {"id": "1", "requirements_refs": ["2", "1.1", "9"]}
+
+        related = executor._get_task_requirements(task)
+        assert [req["id"] for req in related] == ["1.1", "2"]
+        assert executor._get_task_requirements(task) == related
+
+        # Replacing the requirements must not serve the cached matches
+        executor.context_cache["requirements"] = [{"id": "9", "user_story": "New"}]
+        assert [req["id"] for req in executor._get_task_requirements(task)] == ["9"]
+    
+    def test_parse_requirements_keeps_trailing_numbers(self):
+        """Test only the list number is removed from acceptance criteria."""
+        executor = self._setup_executor()
+        requirements_text = """# Requirements Document
+
+## Requirements
+
+### Requirement 1
+
+**User Story:** As a user, I want versioned exports, so that I can share them.
+
+#### Acceptance Criteria
+
+1. THE Exporter SHALL support format version 2.
+12. WHEN 3 exports run, THE Exporter SHALL queue them
+"""
+
+        requirements = executor._parse_requirements(requirements_text)
+        assert requirements[0]["acceptance_criteria"] == [
+            "THE Exporter SHALL support format version 2.",
+            "WHEN 3 exports run, THE Exporter SHALL queue them",
+        ]
+    
+    def test_find_task_by_id_follows_context(self):
+        """Test task lookup includes sub-tasks and follows replaced task lists."""
+        executor = self._setup_executor()
+        sub_task = {"id": "1.1", "title": "Sub task"}
+        executor.context_cache["tasks"] = [
+            {"id": "1", "title": "Parent task", "sub_tasks": [sub_task]}
+        ]
+
+        assert executor._find_task_by_id("1")["title"] == "Parent task"
+        assert executor._find_task_by_id("1.1") is sub_task
+        assert executor._find_task_by_id("2") is None
+
+        # Replacing the task list must not serve lookups from the old one
+        executor.context_cache["tasks"] = [{"id": "2", "title": "New task"}]
+        assert executor._find_task_by_id("1") is None
+        assert executor._find_task_by_id("2")["title"] == "New task"
+    
     def test_context_loading_error_handling(self):
         """Test error handling in context loading."""
         # Create executor with non-existent feature